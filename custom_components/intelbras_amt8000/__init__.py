@@ -1,22 +1,67 @@
 # Archivo: __init__.py
 
+from __future__ import annotations
+
 import asyncio
 import logging
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant # Asegurarse de que esté importado
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-
-from .client import Client as ISecClient, CommunicationError, AuthError
-from .coordinator import AmtCoordinator
-from .const import DOMAIN, CONF_HOST, CONF_PORT, CONF_PASSWORD, DEFAULT_PORT, SCAN_INTERVAL
+from .client import Client as ISecClient
+from .const import (
+    DOMAIN, CONF_HOST, CONF_PORT, CONF_PASSWORD, CONF_WARM_STANDBY, CONF_EXPORT_HISTORY, DEFAULT_PORT, SCAN_INTERVAL, EXPORT_FILENAME,
+    SETUP_CONCURRENCY, SETUP_DEADLINE, DATA_SETUP_SEMAPHORE, DATA_SETUP_DEADLINE,
+    CONF_SETUP_CONCURRENCY, CONF_SETUP_DEADLINE,
+)
+
+try:
+    import voluptuous as vol
+
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant # Asegurarse de que esté importado
+    from homeassistant.exceptions import ConfigEntryNotReady
+    from homeassistant.helpers.typing import ConfigType
+
+    from .coordinator import AmtCoordinator
+    from .exporter import StatusExporter
+    from .services import async_setup_services
+except ModuleNotFoundError as err:
+    # Sin Home Assistant el paquete solo sirve a las herramientas de línea de comandos
+    # (python -m custom_components.intelbras_amt8000, .loadgen, .proxy). Solo se tolera
+    # que falte el paquete entero: un submódulo ausente dentro de HA debe fallar aquí
+    if err.name not in ("homeassistant", "voluptuous"):
+        raise
+else:
+    # Ajustes de todo el dominio, en configuration.yaml:
+    #   intelbras_amt8000:
+    #     setup_concurrency: 8
+    #     setup_deadline: 20
+    CONFIG_SCHEMA = vol.Schema(
+        {
+            DOMAIN: vol.Schema(
+                {
+                    vol.Optional(CONF_SETUP_CONCURRENCY, default=SETUP_CONCURRENCY): vol.All(
+                        vol.Coerce(int), vol.Range(min=1)
+                    ),
+                    vol.Optional(CONF_SETUP_DEADLINE, default=SETUP_DEADLINE): vol.All(
+                        vol.Coerce(float), vol.Range(min=1)
+                    ),
+                }
+            )
+        },
+        extra=vol.ALLOW_EXTRA,
+    )
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[str] = ["alarm_control_panel", "sensor"]
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Read the domain-wide setup limits shared by all config entries."""
+    conf = config.get(DOMAIN) or {}
+    hass.data[DATA_SETUP_SEMAPHORE] = asyncio.Semaphore(conf.get(CONF_SETUP_CONCURRENCY, SETUP_CONCURRENCY))
+    hass.data[DATA_SETUP_DEADLINE] = conf.get(CONF_SETUP_DEADLINE, SETUP_DEADLINE)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Intelbras AMT 8000 from a config entry."""
     _LOGGER.debug("Setting up Intelbras AMT 8000 integration from config entry.")
@@ -25,30 +70,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     port = entry.data.get(CONF_PORT, DEFAULT_PORT)
     password = entry.data[CONF_PASSWORD]
 
-    amt_client = ISecClient(host, port)
+    amt_client = ISecClient(host, port, warm_standby=entry.data.get(CONF_WARM_STANDBY, False))
 
     coordinator = AmtCoordinator(
         hass, # <--- ¡CAMBIO CRÍTICO AQUÍ! Pasar hass al coordinador
         hass.async_add_executor_job,
         amt_client,
-        password
+        password,
+        entry.entry_id
     )
 
     _LOGGER.debug("Performing initial data fetch for coordinator.")
-    try:
-        # Intenta la primera conexión y autenticación
-        await coordinator.async_add_executor_job(coordinator.client.connect)
-        await coordinator.async_add_executor_job(coordinator.client.auth, coordinator.password)
-        coordinator._is_connected = True # Marcar como conectado después de la autenticación inicial
-        _LOGGER.info("Initial connection and authentication successful for AMT-8000.")
-
-        await coordinator.async_config_entry_first_refresh()
-    except (CommunicationError, AuthError) as ex:
-        _LOGGER.error("Failed to connect or authenticate to AMT-8000 panel: %s", ex)
-        raise ConfigEntryNotReady from ex
-    except Exception as ex:
-        _LOGGER.error("Unknown error during initial data fetch: %s", ex)
-        raise ConfigEntryNotReady from ex
+    await _async_initial_refresh(hass, entry, coordinator)
+
+    if entry.data.get(CONF_EXPORT_HISTORY, False):
+        coordinator.exporter = StatusExporter(hass, coordinator, hass.config.path(EXPORT_FILENAME))
+        await coordinator.exporter.async_start()
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
     _LOGGER.debug("Coordinator stored in Home Assistant data for entry %s.", entry.entry_id)
@@ -56,17 +93,62 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     _LOGGER.debug("Platforms setup requested.")
 
+    await async_setup_services(hass)
+
     return True
 
 
+async def _async_initial_refresh(hass: HomeAssistant, entry: ConfigEntry, coordinator: AmtCoordinator) -> None:
+    """Run the first connect, auth and status read, bounded in concurrency and time.
+
+    All entries share one semaphore, so at most setup_concurrency panels
+    handshake at once. The deadline starts once a panel gets its slot: a
+    panel still busy setup_deadline seconds later keeps going in the
+    background and the entry is set up without data; one that fails outright
+    raises ConfigEntryNotReady as before.
+    """
+    semaphore = hass.data.setdefault(DATA_SETUP_SEMAPHORE, asyncio.Semaphore(SETUP_CONCURRENCY))
+    deadline = hass.data.get(DATA_SETUP_DEADLINE, SETUP_DEADLINE)
+    started = asyncio.Event()
+
+    async def _async_refresh() -> None:
+        async with semaphore:
+            started.set()
+            # La primera actualización conecta y autentica (coordinator._is_connected es False)
+            await coordinator.async_refresh()
+
+    # Se cancela solo si la entrada se descarga antes de terminar
+    task = entry.async_create_background_task(hass, _async_refresh(), f"{DOMAIN} initial refresh {entry.entry_id}")
+    # La espera en la cola no cuenta para el plazo del panel
+    await started.wait()
+    try:
+        # shield: al vencer el plazo la tarea sigue en segundo plano
+        await asyncio.wait_for(asyncio.shield(task), deadline)
+    except asyncio.TimeoutError:
+        _LOGGER.warning(
+            "AMT-8000 at %s did not answer within %.0f s; finishing its setup in the background.",
+            coordinator.client.host, deadline,
+        )
+        return
+
+    if not coordinator.last_update_success:
+        _LOGGER.error("Failed to connect or authenticate to AMT-8000 panel: %s", coordinator.last_exception)
+        raise ConfigEntryNotReady(str(coordinator.last_exception)) from coordinator.last_exception
+    _LOGGER.info("Initial connection and authentication successful for AMT-8000.")
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading Intelbras AMT 8000 integration for entry %s.", entry.entry_id)
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        # Un panel descargado no debe dejar sin resultados una llamada a profile
+        coordinator.stop_profiling()
+        if coordinator.exporter:
+            await coordinator.exporter.async_stop()
         if coordinator.client:
-            await hass.async_add_executor_job(coordinator.client.close)
+            await coordinator.async_client_job(coordinator.client.close)
             _LOGGER.debug("AMT-8000 client connection closed during unload.")
 
     return unload_ok
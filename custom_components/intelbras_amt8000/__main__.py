@@ -0,0 +1,5 @@
+"""Run the status monitor: python -m custom_components.intelbras_amt8000 --help."""
+
+from .monitor import main
+
+main()
@@ -7,28 +7,13 @@ from homeassistant.components.alarm_control_panel import (
     CodeFormat,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    STATE_ALARM_ARMED_AWAY,
-    STATE_ALARM_ARMED_HOME,
-    STATE_ALARM_DISARMED,
-    STATE_ALARM_TRIGGERED,
-    STATE_UNKNOWN,
-)
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 # MAX_ZONES ya no se importa
 from .client import CommunicationError
 from .coordinator import AmtCoordinator
-from .const import (
-    DOMAIN,
-    ALARM_STATE_DISARMED,
-    ALARM_STATE_ARMED_HOME,
-    ALARM_STATE_ARMED_AWAY,
-    CONF_HOST,
-    CONF_PORT,
-)
+from .const import DOMAIN, CONF_HOST
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -58,48 +43,29 @@ class AmtAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
             | AlarmControlPanelEntityFeature.TRIGGER
         )
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self._attr_unique_id)},
-            name=self.name,
-            manufacturer="Intelbras",
-            model=self.coordinator.data["general_status"].get("model", "AMT 8000"),
-            sw_version=self.coordinator.data["general_status"].get("version", "Unknown"),
-            configuration_url=f"http://{entry.data[CONF_HOST]}:{entry.data[CONF_PORT]}"
-        )
-        
-        self._attr_extra_state_attributes = {} 
-        # --- La línea que cargaba "total_zones" ha sido eliminada ---
+        # DeviceInfo compartido, calculado por el coordinador
+        self._attr_device_info = coordinator.view.device_info
         self._update_state_from_coordinator_data()
 
+    @property
+    def available(self) -> bool:
+        """Return False until the panel has been read once."""
+        # Sin una lectura del panel no se muestra un estado inventado
+        return super().available and self.coordinator.data is not None
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         self._update_state_from_coordinator_data()
         self.async_write_ha_state()
+        self.coordinator.async_entity_written()
 
     def _update_state_from_coordinator_data(self) -> None:
-        """Update the alarm panel state and attributes from coordinator data."""
-        panel_status = self.coordinator.data["general_status"].get("status")
-
-        if panel_status == ALARM_STATE_DISARMED:
-            self._attr_state = STATE_ALARM_DISARMED
-        elif panel_status == ALARM_STATE_ARMED_HOME:
-            self._attr_state = STATE_ALARM_ARMED_HOME
-        elif panel_status == ALARM_STATE_ARMED_AWAY:
-            self._attr_state = STATE_ALARM_ARMED_AWAY
-        elif self.coordinator.data["general_status"].get("siren"):
-            self._attr_state = STATE_ALARM_TRIGGERED
-        else:
-            self._attr_state = STATE_UNKNOWN
-        _LOGGER.debug(f"Alarm panel state updated to: {self._attr_state}")
-
-        # Actualizar atributos extra del estado
-        self._attr_extra_state_attributes["firmware_version"] = self.coordinator.data["general_status"].get("version", "Unknown")
-        self._attr_extra_state_attributes["model"] = self.coordinator.data["general_status"].get("model", "AMT 8000")
-        self._attr_extra_state_attributes["host"] = self._entry.data[CONF_HOST]
-        self._attr_extra_state_attributes["port"] = self._entry.data[CONF_PORT]
-        # --- El comentario sobre total_zones ha sido eliminado ---
-
+        """Update the alarm panel state and attributes from the coordinator view."""
+        view = self.coordinator.view
+        self._attr_state = view.alarm_state
+        self._attr_extra_state_attributes = view.panel_attributes
+        _LOGGER.debug("Alarm panel state updated to: %s", self._attr_state)
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
         """Arm alarm in away mode."""
@@ -109,14 +75,16 @@ class AmtAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
 
         _LOGGER.info("Arming system in away mode.")
         try:
-            result = await self.hass.async_add_executor_job(self.coordinator.client.arm_system, 0)
+            result = await self.coordinator.async_client_job(self.coordinator.client.arm_system, 0)
             if result == 'armed':
+                self.coordinator.invalidate_status()
                 await self.coordinator.async_request_refresh()
             else:
                 _LOGGER.error("Failed to arm system away.")
         except CommunicationError as e:
             _LOGGER.error("Communication error while arming away: %s", e)
             self.coordinator._is_connected = False
+            self.coordinator.invalidate_status()
             await self.coordinator.async_request_refresh()
 
 
@@ -128,14 +96,16 @@ class AmtAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
 
         _LOGGER.info("Arming system in home mode.")
         try:
-            result = await self.hass.async_add_executor_job(self.coordinator.client.arm_system, 0)
+            result = await self.coordinator.async_client_job(self.coordinator.client.arm_system, 0)
             if result == 'armed':
+                self.coordinator.invalidate_status()
                 await self.coordinator.async_request_refresh()
             else:
                 _LOGGER.error("Failed to arm system home.")
         except CommunicationError as e:
             _LOGGER.error("Communication error while arming home: %s", e)
             self.coordinator._is_connected = False
+            self.coordinator.invalidate_status()
             await self.coordinator.async_request_refresh()
 
 
@@ -147,27 +117,31 @@ class AmtAlarmControlPanel(CoordinatorEntity, AlarmControlPanelEntity):
 
         _LOGGER.info("Disarming system.")
         try:
-            result = await self.hass.async_add_executor_job(self.coordinator.client.disarm_system, 0)
+            result = await self.coordinator.async_client_job(self.coordinator.client.disarm_system, 0)
             if result == 'disarmed':
+                self.coordinator.invalidate_status()
                 await self.coordinator.async_request_refresh()
             else:
                 _LOGGER.error("Failed to disarm system.")
         except CommunicationError as e:
             _LOGGER.error("Communication error while disarming: %s", e)
             self.coordinator._is_connected = False
+            self.coordinator.invalidate_status()
             await self.coordinator.async_request_refresh()
 
     async def async_alarm_trigger(self, code: str | None = None) -> None:
         """Trigger panic alarm."""
         _LOGGER.warning("Triggering panic alarm (type 1 for audible).")
         try:
-            result = await self.hass.async_add_executor_job(self.coordinator.client.panic, 0x01)
+            result = await self.coordinator.async_client_job(self.coordinator.client.panic, 0x01)
             if result == 'triggered':
                 _LOGGER.info("Panic alarm successfully triggered.")
+                self.coordinator.invalidate_status()
                 await self.coordinator.async_request_refresh()
             else:
                 _LOGGER.error("Failed to trigger panic alarm.")
         except CommunicationError as e:
             _LOGGER.error("Communication error while triggering panic: %s", e)
             self.coordinator._is_connected = False
+            self.coordinator.invalidate_status()
             await self.coordinator.async_request_refresh()
@@ -0,0 +1,188 @@
+"""Per-panel memory footprint and scaling benchmark.
+
+Builds N complete panels (Client, AmtCoordinator and every entity of the
+sensor and alarm_control_panel platforms) on one Home Assistant core, each
+talking to its own in-memory SimulatedPanel through LoopbackTransport, then
+measures resident memory and tracemalloc allocations per panel and per poll
+cycle. Needs a Home Assistant development environment.
+
+    python -m custom_components.intelbras_amt8000.benchmark --panels 100 500 1000 --cycles 20
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import resource
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from . import alarm_control_panel, sensor
+from .client import Client
+from .const import CONF_HOST, CONF_PASSWORD, CONF_PORT, DEFAULT_PORT, DOMAIN
+from .coordinator import AmtCoordinator
+from .simulator import LoopbackTransport
+
+_PASSWORD = "123456"
+_PLATFORMS = (sensor, alarm_control_panel)
+
+
+def rss_bytes() -> int:
+    """Return the current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # ru_maxrss está en KiB en Linux y en bytes en macOS; solo como aproximación
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def measure() -> Tuple[int, int]:
+    """Collect garbage and return (RSS, bytes currently traced by tracemalloc)."""
+    gc.collect()
+    return rss_bytes(), tracemalloc.get_traced_memory()[0]
+
+
+class BenchPanel:
+    """One panel as set up by async_setup_entry, minus the config entry machinery."""
+
+    def __init__(self, hass: HomeAssistant, index: int) -> None:
+        """Create the client, coordinator and entities of panel number index."""
+        host = f"10.{index // 65536 % 256}.{index // 256 % 256}.{index % 256}"
+        # Solo los atributos que leen las entidades
+        self.entry = SimpleNamespace(
+            entry_id=f"bench_{index}",
+            data={CONF_HOST: host, CONF_PORT: DEFAULT_PORT, CONF_PASSWORD: _PASSWORD},
+        )
+        self.client = Client(host, DEFAULT_PORT, transport_factory=LoopbackTransport)
+        # status_ttl=0: cada ciclo llega al panel en lugar de a la caché
+        self.coordinator = AmtCoordinator(
+            hass, hass.async_add_executor_job, self.client, _PASSWORD, self.entry.entry_id, status_ttl=0
+        )
+        self.entities: List[Any] = []
+
+    async def async_setup(self, hass: HomeAssistant) -> None:
+        """Add the entities of every platform and subscribe them to the coordinator."""
+        hass.data[DOMAIN][self.entry.entry_id] = self.coordinator
+        for platform in _PLATFORMS:
+            await platform.async_setup_entry(hass, self.entry, self.entities.extend)
+        for number, entity in enumerate(self.entities):
+            entity.hass = hass
+            entity.entity_id = f"{type(entity).__module__.rsplit('.', 1)[-1]}.{self.entry.entry_id}_{number}"
+            await entity.async_added_to_hass()
+
+    async def async_teardown(self, hass: HomeAssistant) -> None:
+        """Stop the coordinator, drop the entity states and close the client."""
+        await self.coordinator.async_shutdown()
+        for entity in self.entities:
+            hass.states.async_remove(entity.entity_id)
+        hass.data[DOMAIN].pop(self.entry.entry_id, None)
+        await hass.async_add_executor_job(self.client.close)
+
+
+async def async_poll_all(panels: List[BenchPanel]) -> None:
+    """Run one update cycle of every panel concurrently."""
+    await asyncio.gather(*(panel.coordinator.async_refresh() for panel in panels))
+
+
+async def async_run(hass: HomeAssistant, count: int, cycles: int, top: int) -> Dict[str, Any]:
+    """Benchmark count panels for cycles poll cycles."""
+    rss_start, traced_start = measure()
+
+    started = time.perf_counter()
+    panels = [BenchPanel(hass, index) for index in range(count)]
+    for panel in panels:
+        await panel.async_setup(hass)
+    # First refresh: connect, authenticate and publish the first status
+    await async_poll_all(panels)
+    setup_s = time.perf_counter() - started
+    failed = sum(not panel.coordinator.last_update_success for panel in panels)
+    rss_setup, traced_setup = measure()
+
+    before = tracemalloc.take_snapshot()
+    cycle_times = []
+    for _ in range(cycles):
+        started = time.perf_counter()
+        await async_poll_all(panels)
+        cycle_times.append(time.perf_counter() - started)
+    rss_polled, traced_polled = measure()
+    after = tracemalloc.take_snapshot()
+    growth = [
+        {"where": str(stat.traceback), "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+        for stat in after.compare_to(before, "lineno")[:top]
+        if stat.size_diff > 0
+    ]
+    del before, after
+
+    entities = sum(len(panel.entities) for panel in panels)
+    for panel in panels:
+        await panel.async_teardown(hass)
+    panels.clear()
+    rss_end, traced_end = measure()
+
+    def kib(value: float) -> float:
+        return round(value / 1024, 2)
+
+    return {
+        "panels": count,
+        "entities": entities,
+        "failed_panels": failed,
+        "setup_s": round(setup_s, 3),
+        "cycle_ms": round(sum(cycle_times) / max(len(cycle_times), 1) * 1000, 3),
+        "per_panel_kib": {
+            "rss": kib((rss_setup - rss_start) / count),
+            "traced": kib((traced_setup - traced_start) / count),
+        },
+        # Crecimiento por ciclo; debería tender a cero una vez estabilizado
+        "per_cycle_growth_kib": {
+            "rss": kib((rss_polled - rss_setup) / max(cycles, 1)),
+            "traced": kib((traced_polled - traced_setup) / max(cycles, 1)),
+        },
+        # Memoria trazada que sigue viva después de desmontar todos los paneles
+        "retained_after_teardown_kib": kib(traced_end - traced_start),
+        "top_growth": growth,
+    }
+
+
+async def async_main(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Run the benchmark for every requested panel count."""
+    tracemalloc.start(args.frames)
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        hass.data.setdefault(DOMAIN, {})
+        try:
+            return [await async_run(hass, count, args.cycles, args.top) for count in args.panels]
+        finally:
+            await hass.async_stop(force=True)
+            tracemalloc.stop()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description="Memory footprint benchmark for Intelbras AMT-8000 panels.")
+    parser.add_argument("--panels", type=int, nargs="+", default=[100, 500, 1000],
+                        help="Panel counts to benchmark, one run each.")
+    parser.add_argument("--cycles", type=int, default=20, help="Poll cycles measured per run.")
+    parser.add_argument("--top", type=int, default=10, help="Allocation sites listed by growth during polling.")
+    parser.add_argument("--frames", type=int, default=1, help="Traceback depth kept by tracemalloc.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    # Las entidades se añaden sin EntityPlatform; no avisar por cada una
+    logging.getLogger("homeassistant.helpers.entity").setLevel(logging.ERROR)
+    print(json.dumps(asyncio.run(async_main(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
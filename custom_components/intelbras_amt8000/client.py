@@ -2,11 +2,24 @@
 
 import socket
 import logging
-from typing import Dict, Any, List
+import threading
+import time
+from functools import reduce
+from operator import xor
+from typing import Dict, Any, List, Optional, Tuple
+
+from .debug import LazyHex, Tracer
+from .transport import TcpTransport, Transport
 
 LOGGER = logging.getLogger(__name__)
+FRAME_TRACER = Tracer(LOGGER)
+DECODE_TRACER = Tracer(LOGGER)
+
+timeout = 2  # Initial timeout, until the RTT estimators have samples
 
-timeout = 2  # Set the timeout to 2 seconds
+# Bounds for the RTT-adaptive timeouts
+MIN_TIMEOUT = 1.0 # RFC 6298: un timeout de lectura cierra la sesión, no bajar de 1 s
+MAX_TIMEOUT = 15.0
 
 dst_id = [0x00, 0x00]
 our_id = [0x8F, 0xFF]
@@ -17,11 +30,24 @@ commands = {
     "panic": [0x40, 0x1a],
     "paired_sensors": [0x0B, 0x01]
 }
+command_names = {bytes(value): key for key, value in commands.items()}
+# Commands that are safe to resend on the warm standby connection after a failure
+FAILOVER_RETRY_COMMANDS = {"auth", "status", "arm_disarm", "paired_sensors"}
 
 # Constantes para el procesamiento de zonas (offset de la versión que funciona)
 ZONE_STATUS_PAYLOAD_OFFSET = 22 # The first zone byte within the payload (from the working fork)
 MAX_ZONES = 64 # Maximum number of zones that can be read (8 bytes * 8 bits)
 
+PROBLEMS_PAYLOAD_OFFSET = 71 # bit 1: panel tamper
+
+# Framing: dst(2) + src(2) + length(2) + command(2) + data + checksum(1).
+# The length field counts the command and data bytes.
+FRAME_HEADER_LENGTH = 6
+FRAME_MIN_LENGTH = FRAME_HEADER_LENGTH + 2 + 1
+MAX_FRAME_LENGTH = 1024
+# Below this length a plain byte loop is faster than folding the frame as an integer
+_XOR_FOLD_MIN_LENGTH = 64
+
 def split_into_octets(n):
     """Splits an integer into high and low bytes."""
     if 0 <= n <= 0xFFFF:
@@ -40,6 +66,31 @@ def calculate_checksum(buffer):
     checksum &= 0xFF
     return checksum
 
+def xor_bytes(data) -> int:
+    """Return the XOR of all bytes of data."""
+    size = len(data)
+    if size < _XOR_FOLD_MIN_LENGTH:
+        return reduce(xor, data, 0)
+    # Plegar los datos como un solo entero: O(log n) operaciones en C en lugar de un bucle por byte
+    value = int.from_bytes(data, "little")
+    while size > 1:
+        half = (size + 1) // 2
+        value = (value & ((1 << (half * 8)) - 1)) ^ (value >> (half * 8))
+        size = half
+    return value
+
+def frame_is_valid(frame) -> bool:
+    """Return True if the checksum byte of a complete frame matches its content."""
+    # XOR of every byte including the checksum is 0xFF for a valid frame.
+    return xor_bytes(frame) == 0xFF
+
+def encode_frame(command, data=(), source=None, destination=None) -> bytes:
+    """Build a complete frame (header, command, data and checksum)."""
+    source = our_id if source is None else source
+    destination = dst_id if destination is None else destination
+    body = list(destination) + list(source) + split_into_octets(len(command) + len(data)) + list(command) + list(data)
+    return bytes(body + [calculate_checksum(body)])
+
 def merge_octets(buf):
     """Merge octets."""
     return buf[0] * 256 + buf[1]
@@ -88,7 +139,8 @@ def get_zones_status_from_payload(payload: bytearray, num_zones: int = MAX_ZONES
     required_bytes_for_zones = (num_zones + 7) // 8
     
     if len(payload) < ZONE_STATUS_PAYLOAD_OFFSET + required_bytes_for_zones:
-        LOGGER.warning(f"Payload too short to decode all {num_zones} zones from offset {ZONE_STATUS_PAYLOAD_OFFSET}. Required at least {ZONE_STATUS_PAYLOAD_OFFSET + required_bytes_for_zones} bytes, got {len(payload)}.")
+        LOGGER.warning("Payload too short to decode all %d zones from offset %d. Required at least %d bytes, got %d.",
+                       num_zones, ZONE_STATUS_PAYLOAD_OFFSET, ZONE_STATUS_PAYLOAD_OFFSET + required_bytes_for_zones, len(payload))
         bytes_to_process = payload[ZONE_STATUS_PAYLOAD_OFFSET:]
     else:
         bytes_to_process = payload[ZONE_STATUS_PAYLOAD_OFFSET : ZONE_STATUS_PAYLOAD_OFFSET + required_bytes_for_zones]
@@ -106,7 +158,6 @@ def get_zones_status_from_payload(payload: bytearray, num_zones: int = MAX_ZONES
         if zone_current_idx >= num_zones:
             break
 
-    LOGGER.debug(f"Decoded zones status: {zones_status_dict}")
     return zones_status_dict
 
 
@@ -141,7 +192,9 @@ def build_status(data: bytearray) -> Dict[str, Any]:
             "zones": {}
         }
 
-    expected_payload_length = merge_octets(data[4:6])
+    # The length field counts the two command bytes that precede the payload
+    # (the auth request sends 0x0a for command, device type, 6 digits and version)
+    expected_payload_length = merge_octets(data[4:6]) - 2
 
     if len(data) < 8 + expected_payload_length:
         LOGGER.warning("Received data is shorter than indicated length. Expected: %d, Received: %d. Data: %s",
@@ -150,7 +203,9 @@ def build_status(data: bytearray) -> Dict[str, Any]:
     else:
         payload = data[8 : 8 + expected_payload_length]
 
-    LOGGER.debug("Raw payload for status: %s", payload.hex())
+    traced = DECODE_TRACER.sampled()
+    if traced:
+        LOGGER.debug("Raw payload for status: %s", LazyHex(payload))
 
     status_data = {}
 
@@ -177,14 +232,15 @@ def build_status(data: bytearray) -> Dict[str, Any]:
     status_data["batteryStatus"] = battery_status_for(payload)
 
     status_data["tamper"] = False
-    if len(payload) > 71:
-        status_data["tamper"] = (payload[71] & (1 << 0x01)) > 0
+    if len(payload) > PROBLEMS_PAYLOAD_OFFSET:
+        status_data["tamper"] = (payload[PROBLEMS_PAYLOAD_OFFSET] & (1 << 0x01)) > 0
     else:
         LOGGER.debug("Payload too short for tamper status. Length: %d", len(payload))
 
     status_data["zones"] = get_zones_status_from_payload(payload)
 
-    LOGGER.debug("Decoded status: %s", status_data)
+    if traced:
+        LOGGER.debug("Decoded status: %s", status_data)
     return status_data
 
 
@@ -206,84 +262,324 @@ class AuthError(Exception):
         super().__init__(self.message)
 
 
+class RttEstimator:
+    """Smoothed round-trip time and variance, turned into a timeout like TCP's RTO (RFC 6298)."""
+
+    ALPHA = 1 / 8
+    BETA = 1 / 4
+    K = 4
+
+    def __init__(self, initial=timeout, min_timeout=MIN_TIMEOUT, max_timeout=MAX_TIMEOUT):
+        """Initialize the estimator with the timeout used before the first sample."""
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.srtt: Optional[float] = None
+        self.rttvar: Optional[float] = None
+        self.timeout = initial
+        self.samples = 0
+        self.timeouts = 0
+
+    def observe(self, rtt: float):
+        """Update the estimates with a measured round trip."""
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - self.BETA) * self.rttvar + self.BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - self.ALPHA) * self.srtt + self.ALPHA * rtt
+        self.samples += 1
+        self.timeout = min(self.max_timeout, max(self.min_timeout, self.srtt + self.K * self.rttvar))
+
+    def backoff(self):
+        """Double the timeout after an expiry."""
+        self.timeouts += 1
+        self.timeout = min(self.max_timeout, self.timeout * 2)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the current estimates, in milliseconds."""
+        def ms(value):
+            return None if value is None else round(value * 1000, 1)
+
+        return {
+            "srtt_ms": ms(self.srtt),
+            "rttvar_ms": ms(self.rttvar),
+            "timeout_ms": ms(self.timeout),
+            "samples": self.samples,
+            "timeouts": self.timeouts,
+        }
+
+
+class FrameError(CommunicationError):
+    """Exception raised when a received frame fails validation."""
+
+    def __init__(self, message="Invalid frame received"):
+        """Initialize the error."""
+        super().__init__(message)
+
+
+class FrameDecoder:
+    """Incremental decoder that validates header, length and checksum of replies.
+
+    Invalid frames are dropped and counted; the decoder resynchronizes on the
+    next occurrence of the expected header so the connection can be kept.
+    """
+
+    def __init__(self, source_id=None, destination_id=None):
+        """Initialize the decoder for frames sent by source_id to destination_id."""
+        source_id = dst_id if source_id is None else source_id
+        destination_id = our_id if destination_id is None else destination_id
+        self._prefix = bytes(destination_id + source_id)
+        self._buffer = bytearray()
+        self.frames_received = 0
+        self.frames_discarded = 0
+
+    @property
+    def pending(self) -> int:
+        """Return the number of buffered bytes not yet decoded."""
+        return len(self._buffer)
+
+    def reset(self):
+        """Drop any buffered bytes."""
+        self._buffer.clear()
+
+    def feed(self, data):
+        """Append received bytes to the decoder buffer."""
+        self._buffer += data
+
+    def next_frame(self) -> Optional[bytearray]:
+        """Return the next valid frame, or None if more bytes are needed."""
+        buf = self._buffer
+        prefix = self._prefix
+        while len(buf) >= FRAME_HEADER_LENGTH:
+            if not buf.startswith(prefix):
+                self._discard("unexpected header %s", LazyHex(buf[:FRAME_HEADER_LENGTH]))
+                continue
+
+            frame_length = FRAME_HEADER_LENGTH + ((buf[4] << 8) | buf[5]) + 1
+            if frame_length < FRAME_MIN_LENGTH or frame_length > MAX_FRAME_LENGTH:
+                self._discard("invalid length field %d", frame_length)
+                continue
+            if len(buf) < frame_length:
+                return None
+
+            if len(buf) == frame_length:
+                # Exactly one frame buffered (the usual case): hand over the buffer itself, no copy
+                if not frame_is_valid(buf):
+                    self._discard("checksum mismatch in frame %s", LazyHex(buf))
+                    continue
+                self._buffer = bytearray()
+                self.frames_received += 1
+                return buf
+
+            frame = buf[:frame_length]
+            if not frame_is_valid(frame):
+                self._discard("checksum mismatch in frame %s", LazyHex(frame))
+                continue
+
+            del buf[:frame_length]
+            self.frames_received += 1
+            return frame
+        return None
+
+    def _discard(self, reason, *args):
+        """Drop bytes up to the next candidate header and count the bad frame."""
+        self.frames_discarded += 1
+        LOGGER.debug("Discarding received bytes: " + reason, *args)
+        next_start = self._buffer.find(self._prefix, 1)
+        if next_start == -1:
+            self._buffer.clear()
+        else:
+            del self._buffer[:next_start]
+
+
 class Client:
     """Client to communicate with amt-8000."""
 
-    def __init__(self, host, port, device_type=1, software_version=0x10):
-        """Initialize the client."""
+    def __init__(self, host, port, device_type=1, software_version=0x10, transport_factory=None, warm_standby=False):
+        """Initialize the client.
+
+        transport_factory returns a new, unconnected Transport for each
+        connection; it defaults to TCP to host:port. With warm_standby, a
+        second authenticated connection is kept ready and swapped in as soon
+        as the primary one fails, where the panel allows two sessions.
+        """
         self.host = host
         self.port = port
         self.device_type = device_type
         self.software_version = software_version
-        self._socket = None # Usar un atributo privado para el socket
+        self._transport_factory = transport_factory or (lambda: TcpTransport(self.host, self.port))
+        self._transport: Optional[Transport] = None
         self._is_connected = False # Nuevo flag para el estado de la conexión persistente
+        self._decoder = FrameDecoder()
+        self._connect_rtt = RttEstimator()
+        self._command_rtt: Dict[str, RttEstimator] = {}
+        self.warm_standby = warm_standby
+        self._password = None
+        self._standby: Optional[Transport] = None
+        self._standby_building = False
+        self._standby_lock = threading.Lock()
+        self._closed = False # Tras close(), una conexión de reserva en construcción se descarta
+        # (envío, primer byte, trama completa) del último intercambio, en time.monotonic()
+        self.last_exchange: Optional[Tuple[float, float, float]] = None
+
+    @property
+    def frames_discarded(self) -> int:
+        """Return how many received frames failed validation."""
+        return self._decoder.frames_discarded
+
+    def timeout_diagnostics(self) -> Dict[str, Any]:
+        """Return the RTT estimates and current timeouts for connect and each opcode."""
+        return {
+            "connect": self._connect_rtt.as_dict(),
+            **{name: estimator.as_dict() for name, estimator in self._command_rtt.items()},
+        }
 
     def connect(self):
-        """Establish a persistent socket connection."""
-        if self._is_connected and self._socket:
+        """Establish a persistent connection."""
+        if self._is_connected and self._transport:
             LOGGER.debug("Already connected to %s:%d.", self.host, self.port)
             return True
         
-        # Si hay un socket pero no está conectado (e.g., previo error), cerrar para limpiar
-        if self._socket:
-            try:
-                self._socket.close() 
-            except OSError as e:
-                LOGGER.debug("Error closing stale socket: %s", e)
-            finally:
-                self._socket = None
+        with self._standby_lock:
+            self._closed = False
+        if self._promote_standby():
+            return True
+
+        # Si hay un transporte pero no está conectado (e.g., previo error), cerrar para limpiar
+        self._drop_transport()
 
         LOGGER.debug("Attempting to establish persistent connection to %s:%d", self.host, self.port)
         try:
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self._socket.settimeout(timeout)
-            self._socket.connect((self.host, self.port))
+            self._transport = self._transport_factory()
+            start = time.monotonic()
+            self._transport.connect(self._connect_rtt.timeout)
+            self._connect_rtt.observe(time.monotonic() - start)
             self._is_connected = True
             LOGGER.info("Persistent connection established to %s:%d.", self.host, self.port)
             return True
         except (socket.timeout, ConnectionRefusedError, OSError) as e:
+            if isinstance(e, socket.timeout):
+                self._connect_rtt.backoff()
             self._is_connected = False
-            self._socket = None # Limpiar el socket en caso de fallo
+            self._transport = None # Limpiar el transporte en caso de fallo
             raise CommunicationError(f"Failed to connect to {self.host}:{self.port}: {e}")
 
     def close(self):
-        """Close the persistent socket connection."""
-        if self._socket:
+        """Close the persistent connection (and the standby one, if any)."""
+        with self._standby_lock:
+            self._closed = True
+            standby, self._standby = self._standby, None
+        if standby:
+            standby.close()
+        if self._transport:
             LOGGER.debug("Closing persistent connection.")
+            self._drop_transport()
+
+    def _drop_transport(self):
+        """Close the current transport, if any, and mark the client disconnected."""
+        self._is_connected = False
+        if self._transport:
             try:
-                self._socket.shutdown(socket.SHUT_RDWR)
-                self._socket.close()
+                self._transport.close()
             except OSError as e:
-                LOGGER.debug("Error during socket shutdown/close: %s", e)
+                LOGGER.debug("Error during transport close: %s", e)
             finally:
-                self._socket = None
-                self._is_connected = False
+                self._transport = None
 
     def _send_command_and_receive_response(self, data_to_send: bytes) -> bytearray:
         """Helper to send a command and receive its response using the persistent connection."""
-        if not self._is_connected or not self._socket:
+        if not self._is_connected or not self._transport:
             LOGGER.warning("Attempting to send command without an active connection. Reconnecting.")
             self.connect() # Intenta reconectar si no está conectado
 
+        command = command_names.get(bytes(data_to_send[6:8]), "unknown")
+        try:
+            return self._exchange(data_to_send, command)
+        except FrameError:
+            raise
+        except CommunicationError:
+            # Reenviar por la conexión de reserva solo si repetir el comando es inocuo
+            if command in FAILOVER_RETRY_COMMANDS and self._promote_standby():
+                return self._exchange(data_to_send, command)
+            raise
+
+    def _exchange(self, data_to_send: bytes, command: str) -> bytearray:
+        """Send one frame on the primary transport and return the validated reply."""
+        rtt = self._command_rtt.get(command)
+        if rtt is None:
+            rtt = self._command_rtt[command] = RttEstimator()
         try:
-            self._socket.send(data_to_send)
-            return_data = bytearray(self._socket.recv(1024))
-            LOGGER.debug("Received response for command: %s", return_data.hex())
+            traced = FRAME_TRACER.sampled()
+            if traced:
+                FRAME_TRACER.frame("tx", self.host, data_to_send, command)
+            self._transport.settimeout(rtt.timeout)
+            start = time.monotonic()
+            self._transport.send(data_to_send)
+            first_byte = []
+            return_data = self._receive_frame(first_byte)
+            end = time.monotonic()
+            rtt.observe(end - start)
+            self.last_exchange = (start, first_byte[0] if first_byte else end, end)
+            if traced:
+                FRAME_TRACER.frame("rx", self.host, return_data, command)
             return return_data
+        except FrameError:
+            # El socket sigue siendo válido, solo se descarta la trama
+            raise
         except (socket.timeout, ConnectionResetError, BrokenPipeError) as e:
+            if isinstance(e, socket.timeout):
+                rtt.backoff()
             # En caso de error de comunicación, marcar como desconectado para forzar reconexión
-            self._is_connected = False 
-            self._socket = None
+            self._drop_transport()
             raise CommunicationError(f"Communication error during command: {e}. Connection lost.")
         except OSError as e:
-            self._is_connected = False
-            self._socket = None
+            self._drop_transport()
             raise CommunicationError(f"OS error during command communication: {e}")
 
+    def _receive_frame(self, first_byte: Optional[List[float]] = None) -> bytearray:
+        """Read from the primary transport until a valid frame is decoded."""
+        # Bytes left over from a previous exchange belong to an older command
+        self._decoder.reset()
+        return self._read_frame(self._transport, self._decoder, first_byte)
+
+    def _read_frame(self, transport: Transport, decoder: FrameDecoder,
+                    first_byte: Optional[List[float]] = None) -> bytearray:
+        """Read from a transport until a valid frame is decoded.
+
+        If first_byte is given, the arrival time of the first chunk is appended to it.
+        """
+        discarded_before = decoder.frames_discarded
+        while True:
+            frame = decoder.next_frame()
+            if frame is not None:
+                return frame
+            if decoder.frames_discarded != discarded_before and decoder.pending == 0:
+                raise FrameError(
+                    f"Discarded {decoder.frames_discarded - discarded_before} invalid frame(s) from {self.host}:{self.port}"
+                )
+            chunk = transport.recv(MAX_FRAME_LENGTH)
+            if not chunk:
+                raise ConnectionResetError("Connection closed by the panel")
+            if first_byte is not None and not first_byte:
+                first_byte.append(time.monotonic())
+            decoder.feed(chunk)
+
     def auth(self, password):
         """Create an authentication for the current connection."""
+        payload = self._auth_frame(password)
+        return_data = self._send_command_and_receive_response(payload)
+        self._check_auth_response(return_data)
+        LOGGER.info("Authentication successful.")
+
+        self._password = password
+        if self.warm_standby:
+            self._start_standby()
+        return True
+
+    def _auth_frame(self, password) -> bytes:
+        """Build the authentication frame for a 6-digit password."""
         if not isinstance(password, str):
-            LOGGER.error(f"Password provided to auth() is not a string. Type: {type(password)}, Value: {password}")
+            LOGGER.error("Password provided to auth() is not a string. Type: %s", type(password))
             raise CommunicationError("Password must be a string of 6 digits.")
 
         pass_array = []
@@ -307,19 +603,18 @@ class Client:
         )
 
         cs = calculate_checksum(data)
-        payload = bytes(data + [cs])
-
-        LOGGER.debug("Sending authentication: %s", payload.hex())
-        return_data = self._send_command_and_receive_response(payload)
+        return bytes(data + [cs])
 
+    @staticmethod
+    def _check_auth_response(return_data):
+        """Raise if an authentication reply does not report success."""
         if len(return_data) < 9:
             raise CommunicationError(f"Authentication response too short. Length: {len(return_data)}. Raw: {return_data.hex()}")
 
         result = return_data[8:9][0]
 
         if result == 0:
-            LOGGER.info("Authentication successful.")
-            return True
+            return
         if result == 1:
             raise AuthError("Invalid password")
         if result == 2:
@@ -330,18 +625,90 @@ class Client:
             raise AuthError("Waiting for user permission")
         raise CommunicationError(f"Unknown payload response for authentication: 0x{result:02x}")
 
+    def _start_standby(self):
+        """Open a second authenticated connection in the background, if none is ready."""
+        with self._standby_lock:
+            if self._standby or self._standby_building or not self.warm_standby or self._closed:
+                return
+            self._standby_building = True
+        threading.Thread(target=self._build_standby, name=f"amt8000_standby_{self.host}", daemon=True).start()
+
+    def _build_standby(self):
+        """Connect and authenticate the standby connection (runs in a background thread)."""
+        transport = self._transport_factory()
+        try:
+            transport.connect(self._connect_rtt.timeout)
+            transport.settimeout(self._connect_rtt.timeout + timeout)
+            transport.send(self._auth_frame(self._password))
+            self._check_auth_response(self._read_frame(transport, FrameDecoder()))
+        except (CommunicationError, OSError) as e:
+            # Paneles con pocas sesiones rechazan la segunda conexión: volver al modo normal
+            LOGGER.info("Warm standby connection to %s:%d not available (%s); using single connection.", self.host, self.port, e)
+            try:
+                transport.close()
+            except OSError:
+                pass
+            with self._standby_lock:
+                self._standby_building = False
+            return
+
+        with self._standby_lock:
+            self._standby_building = False
+            if self.warm_standby and self._standby is None and not self._closed:
+                self._standby = transport
+                transport = None
+        if transport is not None:
+            # The client was closed (or another standby won) while connecting
+            transport.close()
+        else:
+            LOGGER.debug("Warm standby connection to %s:%d ready.", self.host, self.port)
+
+    def _promote_standby(self) -> bool:
+        """Replace the failed primary connection with the standby one."""
+        with self._standby_lock:
+            standby, self._standby = self._standby, None
+        if standby is None:
+            return False
+        if not self._standby_alive(standby):
+            self._start_standby()
+            return False
+        self._drop_transport()
+        self._transport = standby
+        self._is_connected = True
+        LOGGER.warning("Primary connection to %s:%d lost; switched to warm standby.", self.host, self.port)
+        self._start_standby()
+        return True
+
+    def _standby_alive(self, transport: Transport) -> bool:
+        """Check with a status request that an idle standby session still answers."""
+        try:
+            transport.settimeout(self._connect_rtt.timeout + timeout)
+            transport.send(encode_frame(commands["status"]))
+            reply = self._read_frame(transport, FrameDecoder())
+            # Una sesión caducada responde con un código de error de un byte, no con el estado
+            if len(reply) <= FRAME_MIN_LENGTH + 1:
+                raise CommunicationError(f"status request rejected with code 0x{reply[8]:02x}")
+            return True
+        except (CommunicationError, OSError) as e:
+            LOGGER.info("Warm standby connection to %s:%d no longer answers (%s); discarding it.", self.host, self.port, e)
+            try:
+                transport.close()
+            except OSError:
+                pass
+            return False
+
     def status(self):
         """Return the current status."""
+        return build_status(self.fetch_status_frame())
+
+    def fetch_status_frame(self) -> bytearray:
+        """Request the status and return the raw, validated reply frame."""
         length = [0x00, 0x02]
         status_data = dst_id + our_id + length + commands["status"]
         cs = calculate_checksum(status_data)
         payload = bytes(status_data + [cs])
 
-        LOGGER.debug("Sending status command: %s", payload.hex())
-        return_data = self._send_command_and_receive_response(payload)
-        
-        status = build_status(return_data)
-        return status
+        return self._send_command_and_receive_response(payload)
 
     def arm_system(self, partition):
         """Arm the system for a given partition."""
@@ -353,7 +720,6 @@ class Client:
         cs = calculate_checksum(arm_data)
         payload = bytes(arm_data + [cs])
 
-        LOGGER.debug("Sending arm command: %s", payload.hex())
         return_data = self._send_command_and_receive_response(payload)
         
         if len(return_data) > 8 and return_data[8] == 0x91:
@@ -373,7 +739,6 @@ class Client:
         cs = calculate_checksum(disarm_data)
         payload = bytes(disarm_data + [cs])
 
-        LOGGER.debug("Sending disarm command: %s", payload.hex())
         return_data = self._send_command_and_receive_response(payload)
         
         if len(return_data) > 8 and return_data[8] == 0x91:
@@ -390,7 +755,6 @@ class Client:
         cs = calculate_checksum(panic_data)
         payload = bytes(panic_data + [cs])
 
-        LOGGER.debug("Sending panic command: %s", payload.hex())
         return_data = self._send_command_and_receive_response(payload)
         
         if len(return_data) > 7 and return_data[7] == 0xfe:
@@ -407,7 +771,6 @@ class Client:
         cs = calculate_checksum(sensors_data)
         payload = bytes(sensors_data + [cs])
 
-        LOGGER.debug("Sending paired sensors command: %s", payload.hex())
         return_data = self._send_command_and_receive_response(payload)
 
         # Check for error response first (0xfd at index 8, if panel sends it)
@@ -430,11 +793,11 @@ class Client:
                         if (byte_value & (1 << bit)) > 0:
                             paired_zones[str(zone_number)] = True
                 else:
-                    LOGGER.warning(f"Datos de paired zones incompletos en el byte {byte_index} del payload esperado.")
+                    LOGGER.warning("Datos de paired zones incompletos en el byte %d del payload esperado.", byte_index)
                     break # Exit if no more data
 
         except Exception as e:
-            LOGGER.error(f"Error procesando datos de sensores emparejados: {e}", exc_info=True)
+            LOGGER.error("Error procesando datos de sensores emparejados: %s", e, exc_info=True)
             return {} # Return an empty dictionary in case of error
 
         return paired_zones
@@ -10,7 +10,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 
 from .client import Client as ISecClient, CommunicationError, AuthError
-from .const import DOMAIN, DEFAULT_PORT
+from .const import DOMAIN, DEFAULT_PORT, CONF_NETWORK, CONF_WARM_STANDBY, CONF_EXPORT_HISTORY
+from .discovery import async_scan_network, guess_local_network
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,6 +20,8 @@ DATA_SCHEMA = vol.Schema(
         vol.Required(CONF_HOST): str,
         vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
         vol.Required(CONF_PASSWORD): str,
+        vol.Optional(CONF_WARM_STANDBY, default=False): bool,
+        vol.Optional(CONF_EXPORT_HISTORY, default=False): bool,
     }
 )
 
@@ -28,36 +31,106 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
     CONNECTION_CLASS = config_entries.CONN_CLASS_LOCAL_POLL
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._discovered_hosts: list[str] = []
+        self._discovery_port = DEFAULT_PORT
+
     async def async_step_user(
         self, user_input: dict | None = None
     ) -> FlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["manual", "scan"])
+
+    async def async_step_manual(
+        self, user_input: dict | None = None
+    ) -> FlowResult:
+        """Handle manual entry of the panel address."""
         errors: dict[str, str] = {}
         if user_input is not None:
-            host = user_input[CONF_HOST]
-            port = user_input[CONF_PORT]
-            password = user_input[CONF_PASSWORD]
+            errors = await self._async_test_connection(user_input)
+            if not errors:
+                return await self._async_create_entry(user_input)
 
-            client = ISecClient(host, port) # Esto es una nueva instancia temporal
+        return self.async_show_form(step_id="manual", data_schema=DATA_SCHEMA, errors=errors)
+
+    async def async_step_scan(
+        self, user_input: dict | None = None
+    ) -> FlowResult:
+        """Scan a network for panels listening on the AMT-8000 port."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
             try:
-                await self.hass.async_add_executor_job(client.connect) # Usar el nuevo connect
-                await self.hass.async_add_executor_job(client.auth, password)
-            except AuthError:
-                errors["base"] = "invalid_auth"
-            except CommunicationError as e:
-                _LOGGER.error("Communication error during config flow: %s", e)
-                errors["base"] = "cannot_connect"
-            except Exception as e:
-                _LOGGER.exception("Unexpected error during config flow connection test")
-                errors["base"] = "unknown"
-            finally:
-                # Asegurarse de cerrar la conexión temporal utilizada para la prueba
-                await self.hass.async_add_executor_job(client.close)
+                self._discovered_hosts = await async_scan_network(
+                    user_input[CONF_NETWORK], user_input[CONF_PORT]
+                )
+            except ValueError:
+                errors["base"] = "invalid_network"
+            else:
+                if self._discovered_hosts:
+                    self._discovery_port = user_input[CONF_PORT]
+                    return await self.async_step_pick()
+                errors["base"] = "no_devices_found"
 
+        default_network = await self.hass.async_add_executor_job(guess_local_network)
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_NETWORK, default=default_network): str,
+                vol.Optional(CONF_PORT, default=DEFAULT_PORT): int,
+            }
+        )
+        return self.async_show_form(step_id="scan", data_schema=schema, errors=errors)
+
+    async def async_step_pick(
+        self, user_input: dict | None = None
+    ) -> FlowResult:
+        """Let the user choose one of the discovered panels."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            user_input = {**user_input, CONF_PORT: self._discovery_port}
+            errors = await self._async_test_connection(user_input)
             if not errors:
-                await self.async_set_unique_id(host)
-                self._abort_if_unique_id_configured()
+                return await self._async_create_entry(user_input)
+
+        configured = self._async_current_ids()
+        hosts = [host for host in self._discovered_hosts if host not in configured]
+        if not hosts:
+            return self.async_abort(reason="already_configured")
+
+        schema = vol.Schema(
+            {
+                vol.Required(CONF_HOST): vol.In(hosts),
+                vol.Required(CONF_PASSWORD): str,
+                vol.Optional(CONF_WARM_STANDBY, default=False): bool,
+                vol.Optional(CONF_EXPORT_HISTORY, default=False): bool,
+            }
+        )
+        return self.async_show_form(step_id="pick", data_schema=schema, errors=errors)
+
+    async def _async_test_connection(self, user_input: dict) -> dict[str, str]:
+        """Connect and authenticate once, returning form errors if any."""
+        errors: dict[str, str] = {}
+        client = ISecClient(user_input[CONF_HOST], user_input[CONF_PORT]) # Esto es una nueva instancia temporal
+        try:
+            await self.hass.async_add_executor_job(client.connect) # Usar el nuevo connect
+            await self.hass.async_add_executor_job(client.auth, user_input[CONF_PASSWORD])
+        except AuthError:
+            errors["base"] = "invalid_auth"
+        except CommunicationError as e:
+            _LOGGER.error("Communication error during config flow: %s", e)
+            errors["base"] = "cannot_connect"
+        except Exception as e:
+            _LOGGER.exception("Unexpected error during config flow connection test")
+            errors["base"] = "unknown"
+        finally:
+            # Asegurarse de cerrar la conexión temporal utilizada para la prueba
+            await self.hass.async_add_executor_job(client.close)
+        return errors
 
-                return self.async_create_entry(title=f"Intelbras AMT 8000 ({host})", data=user_input)
+    async def _async_create_entry(self, user_input: dict) -> FlowResult:
+        """Create the config entry for a tested panel."""
+        host = user_input[CONF_HOST]
+        await self.async_set_unique_id(host)
+        self._abort_if_unique_id_configured()
 
-        return self.async_show_form(step_id="user", data_schema=DATA_SCHEMA, errors=errors)
+        return self.async_create_entry(title=f"Intelbras AMT 8000 ({host})", data=user_input)
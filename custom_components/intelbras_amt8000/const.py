@@ -8,6 +8,8 @@ DOMAIN = "intelbras_amt8000"
 CONF_HOST = "host"
 CONF_PORT = "port"
 CONF_PASSWORD = "password"
+CONF_WARM_STANDBY = "warm_standby" # Mantener una segunda conexión autenticada de reserva
+CONF_EXPORT_HISTORY = "export_history" # Guardar historial de estados en SQLite local
 
 DEFAULT_PORT = 9009
 SCAN_INTERVAL = timedelta(seconds=10) # Frecuencia de actualización de estado
@@ -30,3 +32,51 @@ SENSOR_TYPE_TAMPER = "tamper"
 SENSOR_TYPE_SIREN = "siren"
 # SENSOR_TYPE_ZONES_CLOSED = "zones_all_closed"  <-- ELIMINADO
 SENSOR_TYPE_ZONES_FIRING = "zones_firing"
+
+# LAN discovery
+CONF_NETWORK = "network"
+DISCOVERY_CONCURRENCY = 64 # Sondas TCP simultáneas durante el escaneo
+DISCOVERY_TIMEOUT = 1.0 # Segundos por sonda (conexión + respuesta)
+DISCOVERY_MAX_PREFIX = 22 # Redes más amplias (más de 1024 direcciones) se rechazan
+
+# Battery status reported by the panel mapped to a percentage
+BATTERY_PERCENTAGE = {
+    "full": 100,
+    "middle": 75,
+    "low": 25,
+    "dead": 0,
+}
+
+# Services
+SERVICE_SET_TRACE_SAMPLING = "set_trace_sampling"
+ATTR_EVERY = "every"
+SERVICE_PROFILE = "profile"
+ATTR_CYCLES = "cycles"
+ATTR_ENTRY_ID = "entry_id"
+DEFAULT_PROFILE_CYCLES = 5
+
+# Multiplexing proxy
+PROXY_STATUS_TTL = 1.0 # Segundos que una respuesta de estado se sirve desde caché
+
+# Single-flight status fetch
+STATUS_CACHE_TTL = 2.0 # Segundos durante los que se reutiliza un estado recién leído
+
+# Status history export
+EXPORT_FILENAME = "intelbras_amt8000_history.db"
+EXPORT_BATCH_SIZE = 200 # Filas en memoria antes de escribir un lote
+EXPORT_FLUSH_INTERVAL = timedelta(seconds=60)
+EXPORT_RETENTION_DAYS = 365
+
+# End-to-end latency tracing
+LATENCY_WINDOW = 100 # Actualizaciones sobre las que se resume la latencia
+EVENT_STATE_CHANGED = f"{DOMAIN}_state_changed"
+SENSOR_TYPE_LATENCY = "update_latency"
+
+# Parallel setup of many config entries
+# Valores por defecto de las opciones de configuration.yaml
+SETUP_CONCURRENCY = 8 # Paneles que hacen su conexión inicial a la vez
+SETUP_DEADLINE = 20.0 # Segundos antes de terminar la conexión inicial en segundo plano
+DATA_SETUP_SEMAPHORE = f"{DOMAIN}_setup_semaphore" # Fuera de hass.data[DOMAIN], que solo guarda coordinadores
+DATA_SETUP_DEADLINE = f"{DOMAIN}_setup_deadline"
+CONF_SETUP_CONCURRENCY = "setup_concurrency"
+CONF_SETUP_DEADLINE = "setup_deadline"
@@ -1,21 +1,66 @@
 # Archivo: coordinator.py
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional, Callable
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Callable, Tuple
 from datetime import datetime, timedelta
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    STATE_ALARM_ARMED_AWAY,
+    STATE_ALARM_ARMED_HOME,
+    STATE_ALARM_DISARMED,
+    STATE_ALARM_TRIGGERED,
+    STATE_UNKNOWN,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .client import Client as ISecClient, CommunicationError, AuthError
-from .const import DOMAIN, SCAN_INTERVAL
+from .client import Client as ISecClient, CommunicationError, AuthError, FrameError, build_status
+from .const import (
+    DOMAIN,
+    SCAN_INTERVAL,
+    ALARM_STATE_DISARMED,
+    ALARM_STATE_ARMED_HOME,
+    ALARM_STATE_ARMED_AWAY,
+    BATTERY_PERCENTAGE,
+    STATUS_CACHE_TTL,
+    LATENCY_WINDOW,
+    EVENT_STATE_CHANGED,
+)
+from .debug import Tracer
+from .latency import LatencyTracker, StatusTrace
+from .profiler import CycleProfiler
 
 _LOGGER = logging.getLogger(__name__)
+_TRACER = Tracer(_LOGGER)
+
+_ALARM_STATES = {
+    ALARM_STATE_DISARMED: STATE_ALARM_DISARMED,
+    ALARM_STATE_ARMED_HOME: STATE_ALARM_ARMED_HOME,
+    ALARM_STATE_ARMED_AWAY: STATE_ALARM_ARMED_AWAY,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class AmtStatusView:
+    """Values derived once per update and shared by every entity of the panel."""
+
+    alarm_state: str
+    battery_percent: Optional[int]
+    tamper: bool
+    siren: bool
+    zones_firing: bool
+    device_info: DeviceInfo
+    panel_attributes: Dict[str, Any]
+
 
 class AmtCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     """Coordinate the amt status update for Home Assistant."""
 
-    def __init__(self, hass: HomeAssistant, async_add_executor_job: Callable[..., Any], client: ISecClient, password: str) -> None:
+    def __init__(self, hass: HomeAssistant, async_add_executor_job: Callable[..., Any], client: ISecClient, password: str, entry_id: str, status_ttl: float = STATUS_CACHE_TTL) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
@@ -26,29 +71,269 @@ class AmtCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         self.async_add_executor_job = async_add_executor_job
         self.client = client
         self.password = password
+        self.entry_id = entry_id
         # self.paired_zones ya no es necesario
         self._is_connected = False
-        
-    async def _async_update_data(self) -> Dict[str, Any]:
-        """Fetch and process data from AMT-8000. This is the main update method."""
-        _LOGGER.debug("Attempting to update coordinator data.")
+        self.status_ttl = status_ttl
+        self._status_inflight: Optional[asyncio.Task] = None
+        # Se incrementa con cada invalidate_status(); una lectura de una generación anterior no se reutiliza
+        self._status_generation = 0
+        # Client no es thread-safe: todo uso pasa por este lock, de a un trabajo a la vez
+        self._client_lock = asyncio.Lock()
+        self._status_result: Optional[Dict[str, Any]] = None
+        self._status_time = 0.0
+        self.profiler: Optional[CycleProfiler] = None
+        # Perfilador del ciclo en curso; quien lo pone a None es quien cierra el ciclo
+        self._profiling_cycle: Optional[CycleProfiler] = None
+        self.exporter = None # StatusExporter, cuando el historial está activado
+        self.latency = LatencyTracker(LATENCY_WINDOW)
+        self._fetched_trace: Optional[StatusTrace] = None # Escrito en el executor por _read_status
+        self._trace: Optional[StatusTrace] = None # Traza de los datos a publicar
+        self._active_trace: Optional[StatusTrace] = None # Traza durante la notificación a entidades
+        self._last_alarm_state: Optional[str] = None
+        self._last_zones: Optional[Dict[str, str]] = None
+        self.view: Optional[AmtStatusView] = None
+        self.view = self._build_view({})
 
-        try:
+    def _build_view(self, general_status: Dict[str, Any]) -> AmtStatusView:
+        """Derive the entity-facing view from the general status."""
+        model = general_status.get("model", "AMT 8000")
+        version = general_status.get("version", "Unknown")
+        previous = self.view
+        if previous and previous.device_info["model"] == model and previous.device_info["sw_version"] == version:
+            # Misma identidad del panel: reutilizar los objetos compartidos
+            device_info = previous.device_info
+            panel_attributes = previous.panel_attributes
+        else:
+            device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.entry_id)},
+                name=f"Intelbras AMT 8000 ({self.client.host})",
+                manufacturer="Intelbras",
+                model=model,
+                sw_version=version,
+                configuration_url=f"http://{self.client.host}:{self.client.port}"
+            )
+            panel_attributes = {
+                "firmware_version": version,
+                "model": model,
+                "host": self.client.host,
+                "port": self.client.port,
+            }
+
+        siren = general_status.get("siren", False)
+        alarm_state = _ALARM_STATES.get(general_status.get("status"))
+        if alarm_state is None:
+            alarm_state = STATE_ALARM_TRIGGERED if siren else STATE_UNKNOWN
+
+        return AmtStatusView(
+            alarm_state=alarm_state,
+            battery_percent=BATTERY_PERCENTAGE.get(general_status.get("batteryStatus", "unknown")),
+            tamper=general_status.get("tamper", False),
+            siren=siren,
+            zones_firing=general_status.get("zonesFiring", False),
+            device_info=device_info,
+            panel_attributes=panel_attributes,
+        )
+
+    async def async_client_job(self, target: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking Client call in the executor, one at a time for this panel."""
+        async with self._client_lock:
+            return await self.async_add_executor_job(target, *args)
+
+    def invalidate_status(self) -> None:
+        """Drop the shared status so the next fetch reads the panel again.
+
+        A fetch already in flight is left running, as it holds the client; its
+        result is not cached or handed out and callers fetch again after it.
+        """
+        self._status_result = None
+        self._status_generation += 1
+
+    async def async_fetch_status(self) -> Dict[str, Any]:
+        """Return the panel status, sharing in-flight requests and recent results.
+
+        Concurrent callers await the same round trip, and a result younger than
+        status_ttl is returned without contacting the panel.
+        """
+        while True:
+            if self._status_result is not None and time.monotonic() - self._status_time < self.status_ttl:
+                return self._status_result
+
+            task = self._status_inflight
+            if task is None:
+                task = self._status_inflight = self.hass.async_create_task(self._async_fetch_status_from_panel())
+                task.add_done_callback(self._status_fetch_done)
+            # shield: a cancelled caller must not cancel the fetch shared with others
+            generation, status = await asyncio.shield(task)
+            if generation == self._status_generation:
+                return status
+            # La lectura es anterior a un comando: esperar la siguiente
+
+    def _status_fetch_done(self, task: asyncio.Task) -> None:
+        """Store the result of a finished status fetch."""
+        if task is self._status_inflight:
+            self._status_inflight = None
+        if task.cancelled() or task.exception() is not None:
+            # exception() also marks it retrieved when no caller is left waiting
+            return
+        generation, status = task.result()
+        if generation == self._status_generation:
+            self._status_result = status
+            self._status_time = time.monotonic()
+
+    async def _async_fetch_status_from_panel(self) -> Tuple[int, Dict[str, Any]]:
+        """Ensure an authenticated session and read the status; return it with its generation."""
+        async with self._client_lock:
+            # Generación tomada con el lock: ningún comando puede ejecutarse durante la lectura
+            generation = self._status_generation
             # Siempre intenta asegurar la conexión antes de cualquier comando.
-            await self.async_add_executor_job(self.client.connect) 
-            
+            await self.async_add_executor_job(self.client.connect)
+
             # Autenticar solo si no estamos conectados (autenticados)
-            if not self._is_connected: 
+            if not self._is_connected:
                 _LOGGER.debug("Client not authenticated, attempting authentication.")
                 await self.async_add_executor_job(self.client.auth, self.password)
                 self._is_connected = True
                 _LOGGER.info("Authentication successful.")
 
+            return generation, await self.async_add_executor_job(self._read_status)
+
+    def _read_status(self) -> Dict[str, Any]:
+        """Read and decode the status and start its latency trace (runs in the executor)."""
+        profiler = self.profiler
+        if profiler is None:
+            status = build_status(self._fetch_status_frame())
+        else:
+            with profiler.thread_profile():
+                with profiler.stage(self.client.host, "client_io"):
+                    frame = self._fetch_status_frame()
+                with profiler.stage(self.client.host, "build_status"):
+                    status = build_status(frame)
+        trace = StatusTrace(self.client.last_exchange)
+        trace.mark("decoded")
+        self._fetched_trace = trace
+        return status
+
+    def _fetch_status_frame(self) -> bytearray:
+        """Request the status frame, asking once more on the same session if the reply is invalid."""
+        try:
+            return self.client.fetch_status_frame()
+        except FrameError as err:
+            _LOGGER.debug("Discarded invalid status frame from %s, retrying once: %s", self.client.host, err)
+            return self.client.fetch_status_frame()
+
+    def start_profiling(self, profiler: CycleProfiler) -> None:
+        """Profile the next cycles with a profiler shared by the panels of one service call."""
+        profiler.add_panel(self.client.host)
+        self.profiler = profiler
+        _LOGGER.info("Profiling the next %d update cycle(s) of %s.", profiler.cycles, self.client.host)
+
+    def stop_profiling(self) -> None:
+        """Detach from the profiler on unload, so the other panels of the call can still write results."""
+        profiler, self.profiler = self.profiler, None
+        if profiler is None:
+            return
+        if self._profiling_cycle is profiler:
+            self._profiling_cycle = None
+            profiler.cycle_failed()
+        profiler.drop_panel(self.client.host)
+        if profiler.complete:
+            self.hass.async_create_task(self._async_write_profile(profiler))
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, tracing the update and timing the fan-out while profiling."""
+        trace, self._trace = self._trace, None
+        if trace is not None:
+            trace.mark("published")
+        self._active_trace = trace
+        profiler = self.profiler
+        try:
+            if profiler is None:
+                super().async_update_listeners()
+            else:
+                with profiler.stage(self.client.host, "entity_fanout"):
+                    super().async_update_listeners()
+        finally:
+            self._active_trace = None
+
+        if trace is not None:
+            self._finish_trace(trace)
+        # Tras un ciclo fallido HA también notifica a los listeners: ese ciclo ya se cerró y no cuenta
+        if profiler is not None and self._profiling_cycle is profiler and self.last_update_success:
+            self._profiling_cycle = None
+            if profiler.cycle_finished(self.client.host):
+                self.profiler = None
+                if profiler.complete:
+                    self.hass.async_create_task(self._async_write_profile(profiler))
+
+    @callback
+    def async_entity_written(self) -> None:
+        """Record that an entity wrote its state for the update being published."""
+        if self._active_trace is not None:
+            self._active_trace.mark("entity_written")
+
+    @callback
+    def _finish_trace(self, trace: StatusTrace) -> None:
+        """Aggregate a finished trace and fire an event if the arm state or a zone changed."""
+        self.latency.record(trace)
+        alarm_state = self.view.alarm_state
+        zones = self.data.get("zones", {})
+        previous_state, previous_zones = self._last_alarm_state, self._last_zones
+        self._last_alarm_state, self._last_zones = alarm_state, zones
+        if previous_zones is None:
+            # Primera actualización: solo se toma como referencia
+            return
+
+        changed_zones = {zone: state for zone, state in zones.items() if previous_zones.get(zone) != state}
+        if not changed_zones and alarm_state == previous_state:
+            return
+        self.hass.bus.async_fire(
+            EVENT_STATE_CHANGED,
+            {
+                "entry_id": self.entry_id,
+                "host": self.client.host,
+                "alarm_state": alarm_state,
+                "previous_alarm_state": previous_state,
+                "zones": changed_zones,
+                "latency": trace.as_dict(),
+            },
+        )
+
+    async def _async_write_profile(self, profiler: CycleProfiler) -> None:
+        """Write profiling results off the event loop."""
+        summary = await self.hass.async_add_executor_job(profiler.write)
+        _LOGGER.info("Profile written to %s.prof/.txt\n%s", profiler.path_base, summary.split("\n\n", 1)[0])
+
+    async def _async_update_data(self) -> Dict[str, Any]:
+        """Fetch and process data from AMT-8000. This is the main update method."""
+        _LOGGER.debug("Attempting to update coordinator data.")
+
+        profiler = self.profiler
+        if profiler is None:
+            return await self._async_update_data_unprofiled()
+        profiler.cycle_started()
+        self._profiling_cycle = profiler
+        try:
+            with profiler.stage(self.client.host, "update"):
+                return await self._async_update_data_unprofiled()
+        except BaseException:
+            # UpdateFailed, or CancelledError when the entry is unloaded or reloaded:
+            # listeners may not run, so end the cycle here unless stop_profiling already did
+            if self._profiling_cycle is profiler:
+                self._profiling_cycle = None
+                profiler.cycle_failed()
+            raise
+
+    async def _async_update_data_unprofiled(self) -> Dict[str, Any]:
+        """Fetch the status and build coordinator.data and the entity view."""
+        try:
             # --- El bloque completo para obtener sensores pareados ha sido eliminado ---
 
-            status_from_client = await self.async_add_executor_job(self.client.status)
+            status_from_client = await self.async_fetch_status()
+            # Sin traza si el estado viene de la caché: ya se publicó con la suya
+            trace, self._fetched_trace = self._fetched_trace, None
             
-            # El diccionario ya no necesita la clave "zones"
             processed_data = {
                 "general_status": {
                     "model": status_from_client.get("model", "N/A"),
@@ -60,13 +345,22 @@ class AmtCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                     "batteryStatus": status_from_client.get("batteryStatus", "unknown"),
                     "tamper": status_from_client.get("tamper", False),
                 },
+                "zones": status_from_client.get("zones", {}),
             }
 
             # --- El bloque completo para procesar y filtrar zonas ha sido eliminado ---
 
-            _LOGGER.debug("Decoded status for coordinator.data: %s", processed_data)
+            self.view = self._build_view(processed_data["general_status"])
+            self._trace = trace
+
+            if _TRACER.sampled():
+                _LOGGER.debug("Decoded status for coordinator.data: %s", processed_data)
             return processed_data
 
+        except FrameError as err:
+            # Trama corrupta: la sesión sigue autenticada, no forzar reconexión
+            _LOGGER.warning("Discarded invalid frame from AMT-8000 (%d so far): %s", self.client.frames_discarded, err)
+            raise UpdateFailed(f"Invalid frame received from AMT-8000: {err}") from err
         except (CommunicationError, AuthError) as err:
             _LOGGER.error("Error de comunicación o autenticación con AMT-8000: %s", err)
             self._is_connected = False
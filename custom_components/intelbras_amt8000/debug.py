@@ -0,0 +1,59 @@
+"""Lazy debug logging and sampled frame tracing for the poll hot path."""
+
+import logging
+
+_sample_every = 1
+
+
+def set_trace_sampling(every: int) -> None:
+    """Trace only one of every N frames/decodes (1 traces everything)."""
+    global _sample_every
+    if every < 1:
+        raise ValueError("Sampling interval must be at least 1")
+    _sample_every = every
+
+
+def get_trace_sampling() -> int:
+    """Return the current sampling interval."""
+    return _sample_every
+
+
+class LazyHex:
+    """Defer bytes.hex() until the log record is actually formatted."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data) -> None:
+        """Wrap the bytes to render."""
+        self._data = data
+
+    def __str__(self) -> str:
+        """Return the hex representation."""
+        return self._data.hex()
+
+    __repr__ = __str__
+
+
+class Tracer:
+    """Sampled debug tracer; costs one level check when debug logging is off."""
+
+    __slots__ = ("_logger", "_count")
+
+    def __init__(self, logger: logging.Logger) -> None:
+        """Initialize the tracer for a module logger."""
+        self._logger = logger
+        self._count = 0
+
+    def sampled(self) -> bool:
+        """Return True if the current event should be traced."""
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return False
+        self._count += 1
+        return self._count % _sample_every == 0
+
+    def frame(self, direction: str, host: str, frame, command: str) -> None:
+        """Log a frame sent or received; callers decide with sampled() first."""
+        self._logger.debug(
+            "frame dir=%s host=%s cmd=%s len=%d data=%s",
+            direction, host, command, len(frame), LazyHex(frame),
+        )
@@ -0,0 +1,27 @@
+"""Diagnostics support for the Intelbras AMT 8000 integration."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_PASSWORD
+from .coordinator import AmtCoordinator
+
+TO_REDACT = {CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: AmtCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "last_update_success": coordinator.last_update_success,
+        "frames_discarded": coordinator.client.frames_discarded,
+        "timeouts": coordinator.client.timeout_diagnostics(),
+        "latency": coordinator.latency.summary(),
+        "general_status": (coordinator.data or {}).get("general_status"),
+    }
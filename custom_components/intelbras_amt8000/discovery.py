@@ -0,0 +1,83 @@
+"""LAN discovery of AMT-8000 panels."""
+
+import asyncio
+import ipaddress
+import logging
+import socket
+from typing import List
+
+from .client import FrameDecoder, MAX_FRAME_LENGTH, commands, encode_frame
+from .const import DEFAULT_PORT, DISCOVERY_CONCURRENCY, DISCOVERY_MAX_PREFIX, DISCOVERY_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+# Unauthenticated status request: harmless, and any AMT-8000 answers it with a valid frame
+PROBE_FRAME = encode_frame(commands["status"])
+
+
+async def async_probe(host: str, port: int = DEFAULT_PORT, timeout: float = DISCOVERY_TIMEOUT) -> bool:
+    """Return True if an AMT-8000 panel answers on host:port."""
+    try:
+        async with asyncio.timeout(timeout):
+            reader, writer = await asyncio.open_connection(host, port)
+            try:
+                writer.write(PROBE_FRAME)
+                await writer.drain()
+                decoder = FrameDecoder()
+                while True:
+                    chunk = await reader.read(MAX_FRAME_LENGTH)
+                    if not chunk:
+                        return False
+                    decoder.feed(chunk)
+                    if decoder.next_frame() is not None:
+                        return True
+                    if decoder.frames_discarded:
+                        return False
+            finally:
+                writer.close()
+    except (TimeoutError, OSError):
+        return False
+
+
+async def async_scan_network(
+    network: str,
+    port: int = DEFAULT_PORT,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+    timeout: float = DISCOVERY_TIMEOUT,
+) -> List[str]:
+    """Probe every host of a network concurrently and return those that answered.
+
+    Raises ValueError for anything but an IPv4 network of at most
+    2^(32 - DISCOVERY_MAX_PREFIX) addresses.
+    """
+    parsed = ipaddress.ip_network(network, strict=False)
+    if parsed.version != 4:
+        raise ValueError(f"Only IPv4 networks can be scanned: {network}")
+    if parsed.prefixlen < DISCOVERY_MAX_PREFIX:
+        raise ValueError(f"Network {network} is wider than /{DISCOVERY_MAX_PREFIX}")
+
+    # Los hosts se generan bajo demanda: solo hay `concurrency` sondas vivas a la vez
+    hosts = parsed.hosts()
+    found: List[ipaddress.IPv4Address] = []
+
+    async def worker() -> None:
+        for host in hosts:
+            if await async_probe(str(host), port, timeout):
+                found.append(host)
+
+    _LOGGER.debug("Scanning %d addresses of %s on port %d", parsed.num_addresses, network, port)
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, parsed.num_addresses))))
+    _LOGGER.info("Discovery found %d AMT-8000 panel(s) on %s", len(found), network)
+    return [str(host) for host in sorted(found)]
+
+
+def guess_local_network() -> str:
+    """Return the /24 network of the interface used for the default route."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        try:
+            # UDP connect only selects a route, nothing is sent
+            sock.connect(("10.255.255.255", 1))
+            address = sock.getsockname()[0]
+        except OSError:
+            address = "192.168.1.1"
+    return str(ipaddress.ip_network(f"{address}/24", strict=False))
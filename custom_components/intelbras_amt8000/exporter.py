@@ -0,0 +1,176 @@
+"""Batched SQLite history of decoded panel status and zone transitions."""
+
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import EXPORT_BATCH_SIZE, EXPORT_FLUSH_INTERVAL, EXPORT_RETENTION_DAYS
+from .coordinator import AmtCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS status (
+        ts REAL NOT NULL,
+        entry_id TEXT NOT NULL,
+        status TEXT,
+        siren INTEGER,
+        zones_firing INTEGER,
+        battery TEXT,
+        tamper INTEGER
+    )""",
+    "CREATE INDEX IF NOT EXISTS status_ts ON status (ts)",
+    """CREATE TABLE IF NOT EXISTS zone_transitions (
+        ts REAL NOT NULL,
+        entry_id TEXT NOT NULL,
+        zone INTEGER NOT NULL,
+        state TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS zone_transitions_ts ON zone_transitions (ts)",
+)
+
+_PRUNE_EVERY = 24 * 3600
+
+
+class StatusExporter:
+    """Buffer each decoded status in memory and commit it to SQLite in batches.
+
+    Rows are appended on the event loop and written from the executor in one
+    transaction per batch, either when the batch is full or on a timer, and
+    once more on unload or when Home Assistant shuts down.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: AmtCoordinator, path: str,
+                 retention_days: int = EXPORT_RETENTION_DAYS, batch_size: int = EXPORT_BATCH_SIZE) -> None:
+        """Initialize the exporter."""
+        self.hass = hass
+        self.coordinator = coordinator
+        self.path = path
+        self.retention_days = retention_days
+        self.batch_size = batch_size
+        self._status_rows: List[Tuple] = []
+        self._zone_rows: List[Tuple] = []
+        self._last_zones: Optional[Dict[str, str]] = None
+        self._connection: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._last_prune = 0.0
+        self._unsubscribers: List[CALLBACK_TYPE] = []
+        self._unsub_final_write: Optional[CALLBACK_TYPE] = None
+
+    async def async_start(self) -> None:
+        """Open the database and start collecting updates."""
+        await self.hass.async_add_executor_job(self._open)
+        self._unsubscribers.append(self.coordinator.async_add_listener(self._handle_update))
+        self._unsubscribers.append(
+            async_track_time_interval(self.hass, self._async_flush_timer, EXPORT_FLUSH_INTERVAL)
+        )
+        # HA no descarga las entradas al detenerse: sin esto se perdería el último lote
+        self._unsub_final_write = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+        )
+        self._unsubscribers.append(self._unsub_final_write)
+        _LOGGER.debug("Exporting status history of %s to %s.", self.coordinator.client.host, self.path)
+
+    async def async_stop(self) -> None:
+        """Stop collecting, write what is buffered and close the database."""
+        for unsubscribe in self._unsubscribers:
+            unsubscribe()
+        self._unsubscribers.clear()
+        await self.async_flush()
+        await self.hass.async_add_executor_job(self._close)
+
+    async def _async_final_write(self, _event: Event) -> None:
+        """Flush and close the database when Home Assistant shuts down."""
+        # El listener de una sola vez ya se retiró al dispararse
+        self._unsubscribers.remove(self._unsub_final_write)
+        self._unsub_final_write = None
+        await self.async_stop()
+
+    @callback
+    def _handle_update(self) -> None:
+        """Buffer the status just published by the coordinator."""
+        if not self.coordinator.last_update_success or not self.coordinator.data:
+            return
+        now = time.time()
+        entry_id = self.coordinator.entry_id
+        general = self.coordinator.data["general_status"]
+        self._status_rows.append((
+            now,
+            entry_id,
+            general.get("status"),
+            int(general.get("siren", False)),
+            int(general.get("zonesFiring", False)),
+            general.get("batteryStatus"),
+            int(general.get("tamper", False)),
+        ))
+
+        zones = self.coordinator.data.get("zones", {})
+        previous = self._last_zones
+        if previous is None:
+            # First sample: record the initial state of every zone
+            self._zone_rows.extend((now, entry_id, int(zone), state) for zone, state in zones.items())
+        else:
+            self._zone_rows.extend(
+                (now, entry_id, int(zone), state)
+                for zone, state in zones.items()
+                if previous.get(zone) != state
+            )
+        self._last_zones = zones
+
+        if len(self._status_rows) + len(self._zone_rows) >= self.batch_size:
+            self.hass.async_create_task(self.async_flush())
+
+    async def _async_flush_timer(self, _now) -> None:
+        """Flush on the periodic timer."""
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write buffered rows in one transaction, off the event loop."""
+        if not self._status_rows and not self._zone_rows:
+            return
+        status_rows, self._status_rows = self._status_rows, []
+        zone_rows, self._zone_rows = self._zone_rows, []
+        try:
+            await self.hass.async_add_executor_job(self._write, status_rows, zone_rows)
+        except sqlite3.Error as err:
+            _LOGGER.error("Failed to write status history to %s: %s", self.path, err)
+
+    def _open(self) -> None:
+        """Open the database and create the schema (executor)."""
+        connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        with connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+        self._connection = connection
+
+    def _close(self) -> None:
+        """Close the database (executor)."""
+        with self._db_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _write(self, status_rows: List[Tuple], zone_rows: List[Tuple]) -> None:
+        """Insert a batch and prune old rows once a day (executor)."""
+        with self._db_lock:
+            connection = self._connection
+            if connection is None:
+                return
+            with connection:
+                connection.executemany("INSERT INTO status VALUES (?, ?, ?, ?, ?, ?, ?)", status_rows)
+                connection.executemany("INSERT INTO zone_transitions VALUES (?, ?, ?, ?)", zone_rows)
+                now = time.time()
+                if now - self._last_prune >= _PRUNE_EVERY:
+                    cutoff = now - self.retention_days * 86400
+                    connection.execute("DELETE FROM status WHERE ts < ?", (cutoff,))
+                    connection.execute("DELETE FROM zone_transitions WHERE ts < ?", (cutoff,))
+                    self._last_prune = now
+        _LOGGER.debug("Wrote %d status and %d zone rows to %s.", len(status_rows), len(zone_rows), self.path)
@@ -0,0 +1,90 @@
+"""End-to-end latency of status updates, from panel bytes to entity state."""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+# Timestamps recorded for each status update, in pipeline order
+STAGES = ("send", "first_byte", "frame_complete", "decoded", "published", "entity_written")
+
+# name -> (stage where it starts, stage where it ends)
+SEGMENTS = {
+    "panel": ("send", "first_byte"),
+    "receive": ("first_byte", "frame_complete"),
+    "decode": ("frame_complete", "decoded"),
+    "publish": ("decoded", "published"),
+    "entities": ("published", "entity_written"),
+    "total": ("send", "entity_written"),
+}
+
+
+class StatusTrace:
+    """time.monotonic() timestamps of one status update as it moves through the stages."""
+
+    __slots__ = ("marks",)
+
+    def __init__(self, exchange: Tuple[float, float, float]) -> None:
+        """Start a trace from the (send, first byte, frame complete) times of the client."""
+        self.marks: Dict[str, float] = dict(zip(STAGES, exchange))
+
+    def mark(self, stage: str) -> None:
+        """Record that the update reached a stage now; later marks of a stage win."""
+        self.marks[stage] = time.monotonic()
+
+    def segments(self) -> Dict[str, float]:
+        """Return the duration of every segment whose two ends were recorded, in seconds."""
+        marks = self.marks
+        return {
+            name: marks[end] - marks[start]
+            for name, (start, end) in SEGMENTS.items()
+            if start in marks and end in marks
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the stage offsets from send and the segment durations, in milliseconds."""
+        send = self.marks["send"]
+        return {
+            "stages_ms": {stage: round((self.marks[stage] - send) * 1000, 3)
+                          for stage in STAGES if stage in self.marks},
+            "segments_ms": {name: round(value * 1000, 3) for name, value in self.segments().items()},
+        }
+
+
+class LatencyTracker:
+    """Keep the segment durations of the last traces of a panel and summarize them."""
+
+    def __init__(self, window: int) -> None:
+        """Initialize the tracker for the last window traces."""
+        self._samples: Dict[str, Deque[float]] = {name: deque(maxlen=window) for name in SEGMENTS}
+        self.last: Optional[StatusTrace] = None
+        self.count = 0
+
+    def record(self, trace: StatusTrace) -> None:
+        """Add a finished trace."""
+        for name, value in trace.segments().items():
+            self._samples[name].append(value)
+        self.last = trace
+        self.count += 1
+
+    @property
+    def last_total_ms(self) -> Optional[float]:
+        """Return the end-to-end time of the last finished trace, in milliseconds."""
+        if self.last is None:
+            return None
+        total = self.last.segments().get("total")
+        return None if total is None else round(total * 1000, 3)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return mean, p95 and max of every segment over the window, in milliseconds."""
+        result: Dict[str, Any] = {"traces": self.count}
+        for name, samples in self._samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            p95 = ordered[min(len(ordered) - 1, max(0, round(0.95 * len(ordered)) - 1))]
+            result[name] = {
+                "mean_ms": round(sum(ordered) / len(ordered) * 1000, 3),
+                "p95_ms": round(p95 * 1000, 3),
+                "max_ms": round(ordered[-1] * 1000, 3),
+            }
+        return result
@@ -0,0 +1,194 @@
+"""Concurrent load generator for AMT-8000 panels.
+
+Runs N clients through the same connect -> auth -> status cycle used by
+AmtCoordinator._async_update_data and reports throughput, latency
+percentiles and error rates.
+
+    python -m custom_components.intelbras_amt8000.loadgen --simulate --clients 50
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .client import Client, CommunicationError, AuthError
+from .const import DEFAULT_PORT
+from .simulator import LoopbackTransport, PanelServer, SimulatedPanel
+from .transport import UnixTransport
+
+
+class PollWorker:
+    """One simulated integration instance polling a panel."""
+
+    def __init__(self, host: str, port: int, password: str, transport_factory=None) -> None:
+        """Initialize the worker."""
+        self.client = Client(host, port, transport_factory=transport_factory)
+        self.password = password
+        self._is_connected = False
+        self.latencies: List[float] = []
+        self.errors: Dict[str, int] = {}
+
+    def cycle(self) -> None:
+        """Run one connect -> auth -> status cycle, recording the outcome."""
+        start = time.perf_counter()
+        try:
+            self.client.connect()
+            if not self._is_connected:
+                self.client.auth(self.password)
+                self._is_connected = True
+            self.client.status()
+        except (CommunicationError, AuthError) as err:
+            self._is_connected = False
+            name = type(err).__name__
+            self.errors[name] = self.errors.get(name, 0) + 1
+            return
+        self.latencies.append(time.perf_counter() - start)
+
+    def close(self) -> None:
+        """Close the worker connection."""
+        self.client.close()
+
+
+def percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(workers: List[PollWorker], elapsed: float, mode: str) -> Dict[str, Any]:
+    """Aggregate the results of all workers."""
+    latencies = sorted(value for worker in workers for value in worker.latencies)
+    errors: Dict[str, int] = {}
+    for worker in workers:
+        for name, count in worker.errors.items():
+            errors[name] = errors.get(name, 0) + count
+    total = len(latencies) + sum(errors.values())
+
+    def ms(value: Optional[float]) -> Optional[float]:
+        return None if value is None else round(value * 1000, 3)
+
+    return {
+        "mode": mode,
+        "clients": len(workers),
+        "duration_s": round(elapsed, 3),
+        "cycles": total,
+        "throughput_per_s": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": ms(percentile(latencies, 0.50)),
+            "p95": ms(percentile(latencies, 0.95)),
+            "p99": ms(percentile(latencies, 0.99)),
+            "max": ms(latencies[-1] if latencies else None),
+        },
+        "error_rate": round(sum(errors.values()) / total, 4) if total else 0.0,
+        "errors": errors,
+    }
+
+
+async def run_executor_mode(workers: List[PollWorker], rate: float, duration: float, max_workers: int) -> None:
+    """Drive the workers from an event loop through a shared executor, as Home Assistant does."""
+    loop = asyncio.get_running_loop()
+    interval = 1 / rate
+    deadline = loop.time() + duration
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+        async def poll(worker: PollWorker) -> None:
+            next_run = loop.time()
+            while next_run < deadline:
+                await loop.run_in_executor(executor, worker.cycle)
+                next_run += interval
+                await asyncio.sleep(max(0.0, next_run - loop.time()))
+
+        await asyncio.gather(*(poll(worker) for worker in workers))
+
+
+def run_thread_mode(workers: List[PollWorker], rate: float, duration: float) -> None:
+    """Drive each worker from its own dedicated thread."""
+    interval = 1 / rate
+    deadline = time.monotonic() + duration
+
+    def poll(worker: PollWorker) -> None:
+        next_run = time.monotonic()
+        while next_run < deadline:
+            worker.cycle()
+            next_run += interval
+            time.sleep(max(0.0, next_run - time.monotonic()))
+
+    threads = [threading.Thread(target=poll, args=(worker,), daemon=True) for worker in workers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+async def async_main(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the load test described by the parsed arguments."""
+    server = None
+    host, port = args.host, args.port
+    transport_factory = None
+    if args.transport == "loopback":
+        # Cada conexión tiene su propio panel, con la contraseña indicada
+        transport_factory = lambda: LoopbackTransport(SimulatedPanel(args.password))
+    elif args.transport == "unix":
+        transport_factory = lambda: UnixTransport(args.unix_path)
+    elif args.simulate:
+        server = PanelServer(password=args.password, latency=args.latency)
+        await server.start()
+        host, port = server.host, server.port
+
+    workers = [PollWorker(host, port, args.password, transport_factory) for _ in range(args.clients)]
+    start = time.perf_counter()
+    try:
+        if args.mode == "threads":
+            await asyncio.get_running_loop().run_in_executor(
+                None, run_thread_mode, workers, args.rate, args.duration
+            )
+        else:
+            await run_executor_mode(workers, args.rate, args.duration, args.workers)
+    finally:
+        elapsed = time.perf_counter() - start
+        for worker in workers:
+            worker.close()
+        if server:
+            await server.stop()
+    return summarize(workers, elapsed, args.mode)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description="Load generator for Intelbras AMT-8000 panels.")
+    parser.add_argument("--host", default="127.0.0.1", help="Panel or stand-in server address.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--password", default="123456")
+    parser.add_argument("--clients", type=int, default=10, help="Number of simulated integration clients.")
+    parser.add_argument("--rate", type=float, default=1.0, help="Status polls per second, per client.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Test duration in seconds.")
+    parser.add_argument("--mode", choices=("executor", "threads"), default="executor",
+                        help="executor: event loop + shared thread pool (Home Assistant model); "
+                             "threads: one dedicated thread per client.")
+    parser.add_argument("--workers", type=int, default=64, help="Executor size in executor mode.")
+    parser.add_argument("--transport", choices=("tcp", "unix", "loopback"), default="tcp",
+                        help="loopback: in-memory scripted panel, no network stack involved.")
+    parser.add_argument("--unix-path", help="Socket path for --transport unix (e.g. a local proxy); required with it.")
+    parser.add_argument("--simulate", action="store_true", help="Start a local stand-in panel server (tcp transport).")
+    parser.add_argument("--latency", type=float, default=0.0, help="Reply delay of the stand-in server, in seconds.")
+    args = parser.parse_args(argv)
+    if args.transport == "unix" and not args.unix_path:
+        parser.error("--unix-path is required with --transport unix")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    args = parse_args(argv)
+    print(json.dumps(asyncio.run(async_main(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
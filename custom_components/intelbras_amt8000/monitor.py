@@ -0,0 +1,181 @@
+"""Stream the decoded status of one or more panels as JSON lines.
+
+Each panel keeps one authenticated Client session and is polled at a fixed
+interval from a shared thread pool; one JSON object per poll (or, with
+--diff, per change) is written to stdout.
+
+    python -m custom_components.intelbras_amt8000 --password 123456 192.168.1.50 10.0.0.7:9009
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .client import AuthError, Client, CommunicationError
+from .const import DEFAULT_PORT
+from .simulator import PanelServer
+
+# Tope de la espera entre reintentos tras un error, en segundos
+MAX_RETRY_DELAY = 60.0
+
+
+def parse_target(target: str, default_port: int) -> Tuple[str, int]:
+    """Split "host" or "host:port" into a host and a port."""
+    host, sep, port = target.rpartition(":")
+    if sep and port.isdigit():
+        return host, int(port)
+    return target, default_port
+
+
+def status_diff(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the keys of current that differ from previous; dicts are compared key by key."""
+    changes: Dict[str, Any] = {}
+    for key, value in current.items():
+        old = previous.get(key)
+        if isinstance(value, dict) and isinstance(old, dict):
+            nested = {name: item for name, item in value.items() if old.get(name) != item}
+            if nested:
+                changes[key] = nested
+        elif old != value:
+            changes[key] = value
+    return changes
+
+
+class PanelMonitor:
+    """Poll one panel over a persistent session and turn each poll into a record."""
+
+    def __init__(self, host: str, port: int, password: str, diff: bool = False) -> None:
+        """Initialize the monitor."""
+        self.client = Client(host, port)
+        self.password = password
+        self.diff = diff
+        self._authenticated = False
+        # Solo se conserva el último estado y el último error: memoria constante
+        self._last_status: Optional[Dict[str, Any]] = None
+        self._last_error: Optional[str] = None
+        self.failures = 0
+
+    def poll(self) -> Optional[Dict[str, Any]]:
+        """Read the status once (blocking) and return the record to emit, if any."""
+        record: Dict[str, Any] = {"ts": round(time.time(), 3), "host": f"{self.client.host}:{self.client.port}"}
+        try:
+            self.client.connect()
+            if not self._authenticated:
+                self.client.auth(self.password)
+                self._authenticated = True
+            status = self.client.status()
+        except (CommunicationError, AuthError) as err:
+            self._authenticated = False
+            self.failures += 1
+            error = f"{type(err).__name__}: {err}"
+            if self.diff and error == self._last_error:
+                return None
+            self._last_error = error
+            record["error"] = error
+            return record
+
+        self.failures = 0
+        previous, self._last_status = self._last_status, status
+        recovered, self._last_error = self._last_error is not None, None
+        if self.diff and previous is not None:
+            changes = status_diff(previous, status)
+            if not changes and not recovered:
+                return None
+            record["changes"] = changes
+        else:
+            record["status"] = status
+        return record
+
+    def retry_delay(self, interval: float) -> float:
+        """Return how long to wait after the last poll, backing off while the panel fails."""
+        if not self.failures:
+            return interval
+        return min(interval * 2 ** min(self.failures, 16), max(interval, MAX_RETRY_DELAY))
+
+    def close(self) -> None:
+        """Close the panel session."""
+        self.client.close()
+
+
+def emit(record: Dict[str, Any]) -> None:
+    """Write one JSON line to stdout."""
+    sys.stdout.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+    sys.stdout.flush()
+
+
+async def run_monitors(monitors: List[PanelMonitor], interval: float, count: Optional[int], max_workers: int) -> None:
+    """Poll every monitor at the interval until count polls each (or forever)."""
+    loop = asyncio.get_running_loop()
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="amt8000_monitor") as executor:
+
+        async def watch(monitor: PanelMonitor) -> None:
+            polls = 0
+            next_run = loop.time()
+            while count is None or polls < count:
+                record = await loop.run_in_executor(executor, monitor.poll)
+                polls += 1
+                # Solo el bucle de eventos escribe: las líneas no se intercalan
+                if record is not None:
+                    emit(record)
+                next_run += monitor.retry_delay(interval)
+                # Si vamos atrasados no se acumulan sondeos pendientes
+                next_run = max(next_run, loop.time())
+                await asyncio.sleep(next_run - loop.time())
+
+        try:
+            await asyncio.gather(*(watch(monitor) for monitor in monitors))
+        finally:
+            for monitor in monitors:
+                await loop.run_in_executor(executor, monitor.close)
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run the monitor described by the parsed arguments."""
+    server = None
+    targets = [parse_target(target, args.port) for target in args.hosts]
+    if args.simulate:
+        server = PanelServer(password=args.password)
+        await server.start()
+        targets.append((server.host, server.port))
+    monitors = [PanelMonitor(host, port, args.password, args.diff) for host, port in targets]
+    try:
+        await run_monitors(monitors, args.interval, args.count, args.workers)
+    finally:
+        if server:
+            await server.stop()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description="Stream the status of Intelbras AMT-8000 panels as JSON lines.")
+    parser.add_argument("hosts", nargs="*", metavar="HOST[:PORT]", help="Panels to monitor.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port for hosts given without one.")
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between polls of each panel.")
+    parser.add_argument("--diff", action="store_true",
+                        help="After the first full status, emit only the fields that changed.")
+    parser.add_argument("--count", type=int, help="Stop after this many polls per panel.")
+    parser.add_argument("--workers", type=int, default=32, help="Panels polled at the same time.")
+    parser.add_argument("--simulate", action="store_true", help="Also monitor a local stand-in panel server.")
+    args = parser.parse_args(argv)
+    if not args.hosts and not args.simulate:
+        parser.error("at least one host is required")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    args = parse_args(argv)
+    try:
+        asyncio.run(async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
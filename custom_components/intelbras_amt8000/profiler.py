@@ -0,0 +1,174 @@
+"""On-demand profiling of coordinator poll cycles."""
+
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Set
+
+_LOGGER = logging.getLogger(__name__)
+
+# Stages reported in the summary, in pipeline order
+STAGES = ("update", "client_io", "build_status", "entity_fanout")
+
+# Desde 3.12 cProfile usa sys.monitoring: un solo perfilador activo por proceso, que ve todos los hilos
+_PROCESS_WIDE = sys.version_info >= (3, 12)
+
+
+class CycleProfiler:
+    """Collect cProfile data and per-stage wall/CPU time for the next N cycles of some panels.
+
+    One profiler serves a whole service call. Its cProfile.Profile is enabled
+    while at least one panel is inside a cycle and disabled in between. On
+    Python 3.12+ that single profile sees executor threads too; on older
+    versions executor jobs are profiled in their own thread and merged when
+    the results are written.
+    """
+
+    def __init__(self, cycles: int, path_base: str) -> None:
+        """Initialize the profiler; results go to path_base + .prof/.txt."""
+        self.cycles = cycles
+        self.path_base = path_base
+        self._profile = cProfile.Profile()
+        self._profile_enabled = False
+        self._profile_unavailable = False
+        self._active_cycles = 0
+        self._thread_profiles: List[cProfile.Profile] = []
+        self._lock = threading.Lock()
+        # panel -> ciclos que faltan
+        self._remaining: Dict[str, int] = {}
+        # panel -> stage -> [count, wall seconds, cpu seconds]
+        self._stages: Dict[str, Dict[str, List[float]]] = {}
+        # Paneles descargados antes de completar sus ciclos
+        self._dropped: Set[str] = set()
+        self._started = time.time()
+
+    def add_panel(self, panel: str) -> None:
+        """Profile the next cycles of a panel."""
+        self._remaining[panel] = self.cycles
+        self._stages[panel] = {}
+
+    def drop_panel(self, panel: str) -> None:
+        """Stop waiting for a panel that was unloaded; its stage timings so far are kept."""
+        if self._remaining.pop(panel, 0) > 0:
+            self._dropped.add(panel)
+
+    def _record(self, panel: str, name: str, wall: float, cpu: float) -> None:
+        """Accumulate one measurement for a stage."""
+        with self._lock:
+            totals = self._stages[panel].setdefault(name, [0, 0.0, 0.0])
+            totals[0] += 1
+            totals[1] += wall
+            totals[2] += cpu
+
+    @contextmanager
+    def stage(self, panel: str, name: str):
+        """Measure wall time and CPU time of the current thread for a stage."""
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            self._record(panel, name, time.perf_counter() - wall_start, time.thread_time() - cpu_start)
+
+    @contextmanager
+    def thread_profile(self):
+        """Profile the enclosed code in the current (executor) thread, where that is needed."""
+        if _PROCESS_WIDE:
+            # El perfil del proceso ya cubre este hilo
+            yield
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            _LOGGER.warning("Another profiler is active in %s; executor code is not profiled",
+                            threading.current_thread().name)
+            yield
+            return
+        try:
+            yield
+        finally:
+            profile.disable()
+            with self._lock:
+                self._thread_profiles.append(profile)
+
+    def cycle_started(self) -> None:
+        """Enable the profile when the first of the overlapping cycles starts."""
+        self._active_cycles += 1
+        if self._active_cycles > 1 or self._profile_unavailable:
+            return
+        try:
+            self._profile.enable()
+        except ValueError:
+            # Otro perfilador (p. ej. el integrado de HA) ya está activo
+            self._profile_unavailable = True
+            _LOGGER.warning("Another profiler is active; writing stage timings only")
+            return
+        self._profile_enabled = True
+
+    def _cycle_ended(self) -> None:
+        """Disable the profile when no cycle is running."""
+        self._active_cycles -= 1
+        if self._active_cycles == 0 and self._profile_enabled:
+            self._profile.disable()
+            self._profile_enabled = False
+
+    def cycle_failed(self) -> None:
+        """End a failed cycle; it does not count towards N."""
+        self._cycle_ended()
+
+    def cycle_finished(self, panel: str) -> bool:
+        """End a successful cycle of a panel; return True when that panel is done."""
+        self._cycle_ended()
+        self._remaining[panel] -= 1
+        return self._remaining[panel] <= 0
+
+    @property
+    def complete(self) -> bool:
+        """Return True when every panel has run all its cycles."""
+        return all(remaining <= 0 for remaining in self._remaining.values())
+
+    def write(self) -> str:
+        """Write the merged pstats file and the text summary; return the summary."""
+        lines = [
+            f"Profiled {self.cycles} cycle(s) of {len(self._stages)} panel(s) in {time.time() - self._started:.1f} s",
+            "Stage CPU time is for the thread running the stage; 'update' runs on the",
+            "event loop and awaits executor jobs, so its wall time includes client_io.",
+        ]
+        for panel, stages in self._stages.items():
+            lines += [
+                "",
+                f"{panel} (unloaded before all cycles ran)" if panel in self._dropped else panel,
+                f"{'stage':<15}{'count':>7}{'wall ms':>12}{'cpu ms':>12}{'wall/cycle':>12}{'cpu/cycle':>12}",
+            ]
+            for name in STAGES:
+                count, wall, cpu = stages.get(name, (0, 0.0, 0.0))
+                per = max(count, 1)
+                lines.append(
+                    f"{name:<15}{count:>7}{wall * 1000:>12.2f}{cpu * 1000:>12.2f}"
+                    f"{wall * 1000 / per:>12.3f}{cpu * 1000 / per:>12.3f}"
+                )
+
+        profiles = [self._profile, *self._thread_profiles] if not self._profile_unavailable else self._thread_profiles
+        # Un perfil nunca activado (p. ej. todos los paneles descargados antes de su primer ciclo) no tiene datos
+        profiles = [profile for profile in profiles if profile.getstats()]
+        top = ""
+        if profiles:
+            stats = pstats.Stats(profiles[0])
+            for profile in profiles[1:]:
+                stats.add(profile)
+            stats.dump_stats(f"{self.path_base}.prof")
+            stream = io.StringIO()
+            stats.stream = stream
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(30)
+            top = stream.getvalue()
+
+        summary = "\n".join(lines) + "\n\n" + top
+        with open(f"{self.path_base}.txt", "w", encoding="utf-8") as summary_file:
+            summary_file.write(summary)
+        return summary
@@ -0,0 +1,200 @@
+"""Multiplexing proxy: many local consumers share one authenticated panel session.
+
+The AMT-8000 accepts very few simultaneous TCP sessions. The proxy keeps a
+single upstream Client session, authenticates local clients itself, answers
+status requests from a short-lived cache and forwards every other command
+upstream one at a time, in arrival order.
+
+    python -m custom_components.intelbras_amt8000.proxy --host 192.168.1.50 --password 123456
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+from .client import (
+    AuthError,
+    Client,
+    CommunicationError,
+    FrameDecoder,
+    FrameError,
+    MAX_FRAME_LENGTH,
+    commands,
+    dst_id,
+    encode_frame,
+    our_id,
+)
+from .const import DEFAULT_PORT, PROXY_STATUS_TTL
+
+LOGGER = logging.getLogger(__name__)
+
+_AUTH = bytes(commands["auth"])
+_STATUS = bytes(commands["status"])
+# Commands that change panel state make any cached status stale
+_STATE_CHANGING = {bytes(commands["arm_disarm"]), bytes(commands["panic"])}
+
+
+def _reply(command, data) -> bytes:
+    """Encode a reply frame addressed to a local client."""
+    return encode_frame(list(command), list(data), source=dst_id, destination=our_id)
+
+
+class PanelProxy:
+    """Share one upstream panel session between many local clients."""
+
+    def __init__(self, client: Client, password: str, status_ttl: float = PROXY_STATUS_TTL) -> None:
+        """Initialize the proxy for an upstream client."""
+        self.client = client
+        self.password = password
+        self.status_ttl = status_ttl
+        # One worker thread: upstream requests are serialized in arrival order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="amt8000_proxy")
+        self._authenticated = False
+        self._status_reply: Optional[bytes] = None
+        self._status_time = 0.0
+        self._status_inflight: Optional[asyncio.Future] = None
+        self._servers: List[asyncio.AbstractServer] = []
+        self.stats = {"clients": 0, "status_cached": 0, "status_upstream": 0, "forwarded": 0}
+
+    async def start_tcp(self, host: str, port: int) -> None:
+        """Accept local clients on a TCP address."""
+        server = await asyncio.start_server(self._handle_client, host, port)
+        self._servers.append(server)
+        LOGGER.info("Proxy for %s:%d listening on %s:%d", self.client.host, self.client.port, host, port)
+
+    async def start_unix(self, path: str) -> None:
+        """Accept local clients on a Unix-domain socket (see transport.UnixTransport)."""
+        server = await asyncio.start_unix_server(self._handle_client, path)
+        self._servers.append(server)
+        LOGGER.info("Proxy for %s:%d listening on %s", self.client.host, self.client.port, path)
+
+    async def stop(self) -> None:
+        """Stop accepting clients and close the upstream session."""
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+        await asyncio.get_running_loop().run_in_executor(self._executor, self.client.close)
+        self._executor.shutdown(wait=False)
+
+    def _request_blocking(self, frame: bytes) -> bytes:
+        """Send a frame upstream, (re)establishing the session if needed."""
+        if not self._authenticated:
+            self.client.connect()
+            self.client.auth(self.password)
+            self._authenticated = True
+        try:
+            return bytes(self.client._send_command_and_receive_response(frame))
+        except FrameError:
+            raise
+        except CommunicationError:
+            self._authenticated = False
+            raise
+
+    async def _request(self, frame: bytes) -> bytes:
+        """Forward a frame upstream through the serialized worker."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._request_blocking, frame)
+
+    async def _status(self, frame: bytes) -> bytes:
+        """Return a status reply, from cache when it is recent enough."""
+        if self._status_reply is not None and time.monotonic() - self._status_time < self.status_ttl:
+            self.stats["status_cached"] += 1
+            return self._status_reply
+        if self._status_inflight is not None:
+            self.stats["status_cached"] += 1
+            return await asyncio.shield(self._status_inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._status_inflight = future
+        try:
+            reply = await self._request(frame)
+        except Exception as err:
+            future.set_exception(err)
+            # Nobody else may be waiting; mark the exception as retrieved
+            future.exception()
+            raise
+        else:
+            self._status_reply = reply
+            self._status_time = time.monotonic()
+            self.stats["status_upstream"] += 1
+            future.set_result(reply)
+            return reply
+        finally:
+            self._status_inflight = None
+
+    def _check_password(self, frame: bytes) -> bool:
+        """Return True if an auth frame carries the configured password."""
+        digits = frame[9:15]
+        return len(digits) == 6 and "".join(str(digit) for digit in digits) == self.password
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one local client until it disconnects."""
+        self.stats["clients"] += 1
+        peer = writer.get_extra_info("peername")
+        decoder = FrameDecoder(source_id=our_id, destination_id=dst_id)
+        authenticated = False
+        try:
+            while chunk := await reader.read(MAX_FRAME_LENGTH):
+                decoder.feed(chunk)
+                while (frame := decoder.next_frame()) is not None:
+                    command = bytes(frame[6:8])
+                    if command == _AUTH:
+                        authenticated = self._check_password(frame)
+                        writer.write(_reply(command, [0x00 if authenticated else 0x01]))
+                    elif not authenticated:
+                        writer.write(_reply(command, [0xFD]))
+                    elif command == _STATUS:
+                        writer.write(await self._status(bytes(frame)))
+                    else:
+                        self.stats["forwarded"] += 1
+                        writer.write(await self._request(bytes(frame)))
+                        if command in _STATE_CHANGING:
+                            self._status_reply = None
+                await writer.drain()
+        except (CommunicationError, AuthError) as err:
+            # Closing tells the local client to reconnect, as a dropped panel session would
+            LOGGER.warning("Upstream error while serving %s: %s", peer, err)
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        finally:
+            self.stats["clients"] -= 1
+            writer.close()
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run the proxy until interrupted."""
+    proxy = PanelProxy(Client(args.host, args.port), args.password, args.status_ttl)
+    await proxy.start_tcp(args.listen_host, args.listen_port)
+    if args.listen_unix:
+        await proxy.start_unix(args.listen_unix)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await proxy.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Share one AMT-8000 session between many local clients.")
+    parser.add_argument("--host", required=True, help="Panel address.")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--listen-host", default="127.0.0.1")
+    parser.add_argument("--listen-port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--listen-unix", help="Also accept clients on this Unix-domain socket path.")
+    parser.add_argument("--status-ttl", type=float, default=PROXY_STATUS_TTL,
+                        help="Seconds a status reply is served from cache.")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(async_main(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
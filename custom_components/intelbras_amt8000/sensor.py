@@ -5,18 +5,18 @@ from homeassistant.components.sensor import SensorEntity
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import AmtCoordinator
+from .latency import SEGMENTS
 from .const import (
     DOMAIN,
-    CONF_HOST,
-    CONF_PORT,
     SENSOR_TYPE_BATTERY,
     SENSOR_TYPE_TAMPER,
     SENSOR_TYPE_SIREN,
     SENSOR_TYPE_ZONES_FIRING,
+    SENSOR_TYPE_LATENCY,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -33,6 +33,7 @@ async def async_setup_entry(
     entities.append(AmtTamperBinarySensor(coordinator, entry))
     entities.append(AmtSirenBinarySensor(coordinator, entry))
     entities.append(AmtZonesFiringBinarySensor(coordinator, entry))
+    entities.append(AmtLatencySensor(coordinator, entry))
 
     # --- Bloque de creación de sensores de zona eliminado ---
     _LOGGER.info("Skipping individual zone sensor setup as it is disabled.")
@@ -56,14 +57,20 @@ class AmtBaseSensor(CoordinatorEntity):
         else:
             self._attr_unique_id = f"{base_unique_id}_{sensor_type}"
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, base_unique_id)},
-            name=f"Intelbras AMT 8000 ({entry.data[CONF_HOST]})",
-            manufacturer="Intelbras",
-            model=self.coordinator.data["general_status"].get("model", "AMT 8000"),
-            sw_version=self.coordinator.data["general_status"].get("version", "Unknown"),
-            configuration_url=f"http://{entry.data[CONF_HOST]}:{entry.data[CONF_PORT]}"
-        )
+        # DeviceInfo compartido, calculado por el coordinador
+        self._attr_device_info = coordinator.view.device_info
+
+    @property
+    def available(self) -> bool:
+        """Return False until the panel has been read once."""
+        # Si el panel no respondió a tiempo en la configuración, la vista aún es la de un estado vacío
+        return super().available and self.coordinator.data is not None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the new state and record it in the latency trace."""
+        super()._handle_coordinator_update()
+        self.coordinator.async_entity_written()
 
 
 class AmtBatterySensor(AmtBaseSensor, SensorEntity):
@@ -75,32 +82,11 @@ class AmtBatterySensor(AmtBaseSensor, SensorEntity):
         self._attr_name = "Intelbras Alarm Battery Status"
         self._attr_device_class = "battery"
         self._attr_unit_of_measurement = "%"
-        self._attr_native_value = self._map_battery_status_to_percentage(
-            self.coordinator.data["general_status"].get("batteryStatus", "unknown")
-        )
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._attr_native_value = self._map_battery_status_to_percentage(
-            self.coordinator.data["general_status"].get("batteryStatus", "unknown")
-        )
-        if self._attr_device_info:
-            self._attr_device_info["model"] = self.coordinator.data["general_status"].get("model", "AMT 8000")
-            self._attr_device_info["sw_version"] = self.coordinator.data["general_status"].get("version", "Unknown")
-        self.async_write_ha_state()
-
-    def _map_battery_status_to_percentage(self, status: str) -> int | None:
-        """Map string battery status to a percentage."""
-        if status == "full":
-            return 100
-        elif status == "middle":
-            return 75
-        elif status == "low":
-            return 25
-        elif status == "dead":
-            return 0
-        return None
+    @property
+    def native_value(self) -> int | None:
+        """Return the battery percentage."""
+        return self.coordinator.view.battery_percent
 
 class AmtTamperBinarySensor(AmtBaseSensor, BinarySensorEntity):
     """Representation of the tamper binary sensor."""
@@ -114,7 +100,7 @@ class AmtTamperBinarySensor(AmtBaseSensor, BinarySensorEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if the entity is on."""
-        return self.coordinator.data["general_status"].get("tamper", False)
+        return self.coordinator.view.tamper
 
     @property
     def state(self) -> str | None:
@@ -123,14 +109,6 @@ class AmtTamperBinarySensor(AmtBaseSensor, BinarySensorEntity):
             return "Tamper Detectado"
         return "Normal"
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self._attr_device_info:
-            self._attr_device_info["model"] = self.coordinator.data["general_status"].get("model", "AMT 8000")
-            self._attr_device_info["sw_version"] = self.coordinator.data["general_status"].get("version", "Unknown")
-        self.async_write_ha_state()
-
 
 class AmtSirenBinarySensor(AmtBaseSensor, BinarySensorEntity):
     """Representation of the siren binary sensor."""
@@ -144,7 +122,7 @@ class AmtSirenBinarySensor(AmtBaseSensor, BinarySensorEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if the entity is on."""
-        return self.coordinator.data["general_status"].get("siren", False)
+        return self.coordinator.view.siren
 
     @property
     def state(self) -> str | None:
@@ -153,14 +131,6 @@ class AmtSirenBinarySensor(AmtBaseSensor, BinarySensorEntity):
             return "Activa"
         return "Inactiva"
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self._attr_device_info:
-            self._attr_device_info["model"] = self.coordinator.data["general_status"].get("model", "AMT 8000")
-            self._attr_device_info["sw_version"] = self.coordinator.data["general_status"].get("version", "Unknown")
-        self.async_write_ha_state()
-
 
 # --- Clase AmtZoneBinarySensor eliminada ---
 
@@ -180,7 +150,7 @@ class AmtZonesFiringBinarySensor(AmtBaseSensor, BinarySensorEntity):
     @property
     def is_on(self) -> bool | None:
         """Return True if the entity is on."""
-        return self.coordinator.data["general_status"].get("zonesFiring", False)
+        return self.coordinator.view.zones_firing
 
     @property
     def state(self) -> str | None:
@@ -189,10 +159,32 @@ class AmtZonesFiringBinarySensor(AmtBaseSensor, BinarySensorEntity):
             return "Disparado"
         return "Normal"
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if self._attr_device_info:
-            self._attr_device_info["model"] = self.coordinator.data["general_status"].get("model", "AMT 8000")
-            self._attr_device_info["sw_version"] = self.coordinator.data["general_status"].get("version", "Unknown")
-        self.async_write_ha_state()
+
+class AmtLatencySensor(AmtBaseSensor, SensorEntity):
+    """End-to-end latency of the last traced update, with per-stage statistics.
+
+    The state is written while the current update is still being traced, so it
+    shows the previous one: from sending the status request to the last entity
+    writing its state. Disabled by default and kept out of the recorder's
+    attributes: the full summary is also in the diagnostics download.
+    """
+
+    _attr_entity_registry_enabled_default = False
+    _unrecorded_attributes = frozenset({"traces", *SEGMENTS})
+
+    def __init__(self, coordinator: AmtCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the latency sensor."""
+        super().__init__(coordinator, entry, SENSOR_TYPE_LATENCY)
+        self._attr_name = "Intelbras Alarm Update Latency"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_native_unit_of_measurement = "ms"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the end-to-end time of the last traced update."""
+        return self.coordinator.latency.last_total_ms
+
+    @property
+    def extra_state_attributes(self):
+        """Return mean, p95 and max of every stage over the recent updates."""
+        return self.coordinator.latency.summary()
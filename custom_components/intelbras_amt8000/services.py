@@ -0,0 +1,72 @@
+"""Services for the Intelbras AMT 8000 integration."""
+
+import logging
+from datetime import datetime
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import (
+    DOMAIN,
+    SERVICE_SET_TRACE_SAMPLING,
+    ATTR_EVERY,
+    SERVICE_PROFILE,
+    ATTR_CYCLES,
+    ATTR_ENTRY_ID,
+    DEFAULT_PROFILE_CYCLES,
+)
+from .debug import set_trace_sampling
+from .profiler import CycleProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+SET_TRACE_SAMPLING_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_EVERY): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+        vol.Optional(ATTR_ENTRY_ID): str,
+    }
+)
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services once for all config entries."""
+    if hass.services.has_service(DOMAIN, SERVICE_SET_TRACE_SAMPLING):
+        return
+
+    async def async_set_trace_sampling(call: ServiceCall) -> None:
+        """Trace one of every N frames while debug logging is enabled."""
+        set_trace_sampling(call.data[ATTR_EVERY])
+        _LOGGER.info("Frame trace sampling set to 1 of every %d.", call.data[ATTR_EVERY])
+
+    async def async_profile(call: ServiceCall) -> None:
+        """Profile the next N update cycles of one or all panels."""
+        coordinators = hass.data.get(DOMAIN, {})
+        entry_id = call.data.get(ATTR_ENTRY_ID)
+        if entry_id is not None:
+            if entry_id not in coordinators:
+                raise HomeAssistantError(f"No Intelbras AMT 8000 entry with id {entry_id}")
+            coordinators = {entry_id: coordinators[entry_id]}
+
+        if any(coordinator.profiler is not None for coordinator in hass.data.get(DOMAIN, {}).values()):
+            # cProfile admite un solo perfilador activo por proceso (Python 3.12+)
+            raise HomeAssistantError("A profile of Intelbras AMT 8000 panels is already running")
+
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        suffix = f"_{entry_id}" if entry_id is not None else ""
+        # Un solo perfilador para todos los paneles de la llamada
+        profiler = CycleProfiler(call.data[ATTR_CYCLES], hass.config.path(f"{DOMAIN}_profile{suffix}_{stamp}"))
+        for coordinator in coordinators.values():
+            coordinator.start_profiling(profiler)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_SET_TRACE_SAMPLING, async_set_trace_sampling, schema=SET_TRACE_SAMPLING_SCHEMA
+    )
+    hass.services.async_register(DOMAIN, SERVICE_PROFILE, async_profile, schema=PROFILE_SCHEMA)
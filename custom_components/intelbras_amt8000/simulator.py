@@ -0,0 +1,200 @@
+"""Stand-in AMT-8000 panel used by the load and benchmark tools."""
+
+import asyncio
+import logging
+import socket
+from typing import Dict, List, Optional
+
+from .client import (
+    FrameDecoder,
+    MAX_FRAME_LENGTH,
+    PROBLEMS_PAYLOAD_OFFSET,
+    ZONE_STATUS_PAYLOAD_OFFSET,
+    commands,
+    dst_id,
+    encode_frame,
+    our_id,
+)
+from .transport import Transport
+
+LOGGER = logging.getLogger(__name__)
+
+STATUS_PAYLOAD_LENGTH = 143
+
+_ARM_STATUS_BITS = {
+    "disarmed": 0x00,
+    "partial_armed": 0x01,
+    "armed_away": 0x03,
+}
+
+_BATTERY_CODES = {
+    "dead": 0x01,
+    "low": 0x02,
+    "middle": 0x03,
+    "full": 0x04,
+}
+
+
+class SimulatedPanel:
+    """Scripted panel that answers frames the way an AMT-8000 does."""
+
+    def __init__(self, password: str = "123456", version=(1, 0, 0)) -> None:
+        """Initialize the simulated panel state."""
+        self.password = [int(char) for char in password]
+        self.version = version
+        self.status = "disarmed"
+        self.siren = False
+        self.zones_firing = False
+        self.tamper = False
+        self.battery = "full"
+        self.open_zones: set[int] = set()
+        self.authenticated = False
+        self.requests: Dict[str, int] = {}
+
+    def status_payload(self) -> bytes:
+        """Return the status payload for the current simulated state."""
+        payload = bytearray(STATUS_PAYLOAD_LENGTH)
+        payload[0] = 0x01
+        payload[1:4] = bytes(self.version)
+        flags = _ARM_STATUS_BITS[self.status] << 5
+        if self.zones_firing:
+            flags |= 0x8
+        if not self.open_zones:
+            flags |= 0x4
+        if self.siren:
+            flags |= 0x2
+        payload[20] = flags
+        for zone in self.open_zones:
+            index = ZONE_STATUS_PAYLOAD_OFFSET + (zone - 1) // 8
+            payload[index] |= 1 << ((zone - 1) % 8)
+        if self.tamper:
+            payload[PROBLEMS_PAYLOAD_OFFSET] |= 1 << 0x01
+        payload[134] = _BATTERY_CODES[self.battery]
+        return bytes(payload)
+
+    def handle(self, frame: bytes) -> bytes:
+        """Return the reply frame for a validated request frame."""
+        command = list(frame[6:8])
+        data = frame[8:-1]
+        name = next((key for key, value in commands.items() if value == command), "unknown")
+        self.requests[name] = self.requests.get(name, 0) + 1
+
+        if name == "auth":
+            result = 0x00 if list(data[1:7]) == self.password else 0x01
+            self.authenticated = result == 0x00
+            return self._reply(command, [result])
+        if name == "status":
+            return self._reply(command, self.status_payload())
+        if name == "arm_disarm":
+            self.status = "armed_away" if data[1] == 0x01 else "disarmed"
+            return self._reply(command, [0x91])
+        if name == "panic":
+            self.siren = True
+            return self._reply([command[0], 0xFE], [])
+        if name == "paired_sensors":
+            return self._reply(command, bytes(8))
+        return self._reply(command, [0xFD])
+
+    @staticmethod
+    def _reply(command: List[int], data) -> bytes:
+        """Encode a reply frame addressed to the client."""
+        return encode_frame(command, list(data), source=dst_id, destination=our_id)
+
+
+class LoopbackTransport(Transport):
+    """In-memory transport wired straight to a SimulatedPanel.
+
+    Replies are produced synchronously inside send(), so a full
+    Client -> build_status round trip never touches the network stack.
+    """
+
+    def __init__(self, panel: Optional[SimulatedPanel] = None) -> None:
+        """Initialize the transport, with a fresh panel unless one is given."""
+        self.panel = panel or SimulatedPanel()
+        self._decoder = FrameDecoder(source_id=our_id, destination_id=dst_id)
+        self._inbox = bytearray()
+        self._open = False
+
+    def connect(self, timeout: float) -> None:
+        """Open the loopback stream."""
+        self._open = True
+        self._decoder.reset()
+        self._inbox.clear()
+
+    def settimeout(self, timeout: float) -> None:
+        """Timeouts are meaningless in memory."""
+
+    def send(self, data: bytes) -> None:
+        """Hand the bytes to the panel and queue its replies."""
+        if not self._open:
+            raise BrokenPipeError("Loopback transport is closed")
+        self._decoder.feed(data)
+        while (frame := self._decoder.next_frame()) is not None:
+            self._inbox += self.panel.handle(frame)
+
+    def recv(self, size: int) -> bytes:
+        """Return queued reply bytes."""
+        if not self._open:
+            return b""
+        if not self._inbox:
+            raise socket.timeout("timed out")
+        data = bytes(self._inbox[:size])
+        del self._inbox[:size]
+        return data
+
+    def close(self) -> None:
+        """Close the loopback stream."""
+        self._open = False
+
+
+class PanelServer:
+    """TCP server exposing one SimulatedPanel per accepted connection."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, password: str = "123456", latency: float = 0.0) -> None:
+        """Initialize the server."""
+        self.host = host
+        self.port = port
+        self.password = password
+        self.latency = latency
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    async def start(self) -> None:
+        """Start listening; the bound port is stored in self.port."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        LOGGER.info("Simulated panel listening on %s:%d", self.host, self.port)
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._server:
+            self._server.close()
+            self._server = None
+        # Let handlers finish on their own: cancelling them makes asyncio log spurious errors
+        for writer in self._connections.values():
+            writer.close()
+        if self._connections:
+            await asyncio.wait(list(self._connections))
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Answer frames from a single client until it disconnects."""
+        panel = SimulatedPanel(self.password)
+        decoder = FrameDecoder(source_id=our_id, destination_id=dst_id)
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                chunk = await reader.read(MAX_FRAME_LENGTH)
+                if not chunk:
+                    break
+                decoder.feed(chunk)
+                while (frame := decoder.next_frame()) is not None:
+                    if self.latency:
+                        await asyncio.sleep(self.latency)
+                    writer.write(panel.handle(frame))
+                await writer.drain()
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
@@ -0,0 +1,111 @@
+"""Byte-stream transports used by the client below the framing layer."""
+
+import socket
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class Transport(ABC):
+    """Blocking byte stream to a panel.
+
+    Implementations raise socket.timeout (TimeoutError) when a receive
+    expires and OSError subclasses when the stream breaks, as sockets do.
+    """
+
+    @abstractmethod
+    def connect(self, timeout: float) -> None:
+        """Open the stream, waiting at most timeout seconds."""
+
+    @abstractmethod
+    def settimeout(self, timeout: float) -> None:
+        """Set the timeout for subsequent send/recv calls."""
+
+    @abstractmethod
+    def send(self, data: bytes) -> None:
+        """Send all of data."""
+
+    @abstractmethod
+    def recv(self, size: int) -> bytes:
+        """Receive up to size bytes; b"" means the peer closed the stream."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Close the stream."""
+
+
+class _SocketTransport(Transport):
+    """Transport backed by a stream socket."""
+
+    family = socket.AF_INET
+
+    def __init__(self) -> None:
+        """Initialize the transport."""
+        self._sock: Optional[socket.socket] = None
+
+    @abstractmethod
+    def _address(self):
+        """Return the address passed to socket.connect()."""
+
+    def connect(self, timeout: float) -> None:
+        """Open the socket."""
+        self._sock = socket.socket(self.family, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        try:
+            self._sock.connect(self._address())
+        except OSError:
+            self._sock.close()
+            self._sock = None
+            raise
+
+    def settimeout(self, timeout: float) -> None:
+        """Set the socket timeout."""
+        self._sock.settimeout(timeout)
+
+    def send(self, data: bytes) -> None:
+        """Send all of data."""
+        self._sock.sendall(data)
+
+    def recv(self, size: int) -> bytes:
+        """Receive up to size bytes."""
+        return self._sock.recv(size)
+
+    def close(self) -> None:
+        """Shut down and close the socket."""
+        if self._sock is None:
+            return
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        finally:
+            self._sock.close()
+            self._sock = None
+
+
+class TcpTransport(_SocketTransport):
+    """TCP connection to a panel (or to a proxy on TCP)."""
+
+    def __init__(self, host: str, port: int) -> None:
+        """Initialize the transport for host:port."""
+        super().__init__()
+        self.host = host
+        self.port = port
+
+    def _address(self):
+        """Return the TCP address."""
+        return (self.host, self.port)
+
+
+class UnixTransport(_SocketTransport):
+    """Unix-domain socket connection, e.g. to a local proxy."""
+
+    family = socket.AF_UNIX
+
+    def __init__(self, path: str) -> None:
+        """Initialize the transport for a socket path."""
+        super().__init__()
+        self.path = path
+
+    def _address(self):
+        """Return the socket path."""
+        return self.path